@@ -1,6 +1,7 @@
 """Unified per-mailbox SQLite cache.
 
-Three tables, one file, zero new dependencies (sqlite3 is in stdlib).
+Four tables (plus sync state), one file, zero new dependencies (sqlite3
+is in stdlib).
 
 * `body_format_cache`     — converted email bodies (HTML -> markdown), keyed
                             by (message_id, format).
@@ -9,6 +10,9 @@ Three tables, one file, zero new dependencies (sqlite3 is in stdlib).
 * `embedding_cache`       — float32 vectors for semantic_search, keyed by
                             (text_hash, model). Backwards-compatible with
                             the old data/embeddings/embeddings.json.
+* `folder_index`          — folder ID -> name/parent per mailbox, kept
+                            current with SyncFolderHierarchy deltas; the
+                            token lives in `folder_sync_state`.
 
 Why SQLite, not a vector DB:
     Forking users should not need to stand up an extra service. The cache
@@ -59,6 +63,20 @@ CREATE TABLE IF NOT EXISTS embedding_cache (
     PRIMARY KEY (text_hash, model)
 );
 
+CREATE TABLE IF NOT EXISTS folder_index (
+    mailbox    TEXT NOT NULL,
+    folder_id  TEXT NOT NULL,
+    name       TEXT,
+    parent_id  TEXT,
+    PRIMARY KEY (mailbox, folder_id)
+);
+
+CREATE TABLE IF NOT EXISTS folder_sync_state (
+    mailbox     TEXT PRIMARY KEY,
+    sync_state  TEXT NOT NULL,
+    updated_at  REAL NOT NULL
+);
+
 CREATE INDEX IF NOT EXISTS idx_embedding_model ON embedding_cache(model);
 CREATE INDEX IF NOT EXISTS idx_attachment_extractor ON attachment_text_cache(extractor);
 """
@@ -221,6 +239,64 @@ class SQLiteCache:
                 row = c.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()
             return row[0]
 
+    # ----------------------------- folder index -----------------------------
+
+    def get_folder_index(
+        self, mailbox: str
+    ) -> Tuple[Optional[str], List[Tuple[str, Optional[str], Optional[str]]]]:
+        """Return ``(sync_state, [(folder_id, name, parent_id), ...])``.
+
+        ``sync_state`` is None when the mailbox has never been synced.
+        """
+        with self._conn() as c:
+            row = c.execute(
+                "SELECT sync_state FROM folder_sync_state WHERE mailbox=?",
+                (mailbox,),
+            ).fetchone()
+            if not row:
+                return None, []
+            rows = c.execute(
+                "SELECT folder_id, name, parent_id FROM folder_index WHERE mailbox=?",
+                (mailbox,),
+            ).fetchall()
+            return row[0], [tuple(r) for r in rows]
+
+    def apply_folder_index(
+        self,
+        mailbox: str,
+        sync_state: str,
+        upserts: Iterable[Tuple[str, Optional[str], Optional[str]]],
+        deletes: Iterable[str],
+        replace: bool = False,
+    ) -> None:
+        """Apply one hierarchy sync to the stored index atomically.
+
+        ``replace`` drops the mailbox's existing rows first (full sync).
+        """
+        with self._conn() as c:
+            c.execute("BEGIN")
+            try:
+                if replace:
+                    c.execute("DELETE FROM folder_index WHERE mailbox=?", (mailbox,))
+                c.executemany(
+                    "DELETE FROM folder_index WHERE mailbox=? AND folder_id=?",
+                    [(mailbox, folder_id) for folder_id in deletes],
+                )
+                c.executemany(
+                    "INSERT OR REPLACE INTO folder_index "
+                    "(mailbox, folder_id, name, parent_id) VALUES (?, ?, ?, ?)",
+                    [(mailbox, *row) for row in upserts],
+                )
+                c.execute(
+                    "INSERT OR REPLACE INTO folder_sync_state "
+                    "(mailbox, sync_state, updated_at) VALUES (?, ?, ?)",
+                    (mailbox, sync_state, time.time()),
+                )
+                c.execute("COMMIT")
+            except Exception:
+                c.execute("ROLLBACK")
+                raise
+
     # ----------------------- one-shot legacy migration -----------------------
 
     def import_legacy_embeddings_json(
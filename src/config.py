@@ -99,6 +99,13 @@ class Settings(BaseSettings):
     cache_ttl: int = 300
     connection_pool_size: int = 10
     request_timeout: int = 30
+    # Items requested per EWS FindItem page. exchangelib defaults to 100,
+    # so a 1000-item search cost ten round-trips. Clamped to [1, 1000]
+    # (1000 is Exchange's default EWSFindCountLimit).
+    ews_page_size: int = 1000
+    # Seconds a search_emails response is replayed for identical calls.
+    # Opt-in: 0 (the default) disables; ENABLE_CACHE=false also disables it.
+    search_cache_ttl: int = 0
 
     # Rate limiting
     rate_limit_enabled: bool = True
@@ -311,6 +318,16 @@ class Settings(BaseSettings):
             self.progress_notification_interval_seconds,
             low=5, high=60, default=10,
         )
+        self.ews_page_size = _clamp_int(
+            "EWS_PAGE_SIZE",
+            self.ews_page_size,
+            low=1, high=1000, default=1000,
+        )
+        self.search_cache_ttl = _clamp_int(
+            "SEARCH_CACHE_TTL",
+            self.search_cache_ttl,
+            low=0, high=3600, default=0,
+        )
 
         return self
 
@@ -81,6 +81,7 @@ from .tools import (
     # Compound tools (2) — return structured context, no LLM call
     GenerateBriefingTool, PrepareMeetingTool,
 )
+from .tools.folder_tools import set_folder_index_store
 
 
 # Errors that indicate the Exchange connection pool simply wasn't
@@ -491,6 +492,10 @@ class EWSMCPServer:
         # Initialize components
         self.auth_handler = AuthHandler(self.settings)
         self.ews_client = EWSClient(self.settings, self.auth_handler)
+        # Persist the folder-ID index in the per-mailbox SQLite cache so a
+        # restart syncs hierarchy deltas instead of re-walking the tree.
+        if self.settings.enable_cache:
+            set_folder_index_store(lambda: self.ews_client.sqlite_cache)
         self.error_handler = ErrorHandler()
         self.audit_logger = AuditLogger()
 
@@ -501,6 +506,8 @@ class EWSMCPServer:
 
         # Tool registry
         self.tools = {}
+        # MCP Tool descriptors for tools/list, built once from self.tools
+        self._tool_list = None
 
         # OpenAPI adapter (initialized after tools are registered)
         self.openapi_adapter = None
@@ -538,14 +545,18 @@ class EWSMCPServer:
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
             """List all available tools."""
-            return [
-                Tool(
-                    name=tool.get_schema()["name"],
-                    description=tool.get_schema()["description"],
-                    inputSchema=tool.get_schema()["inputSchema"]
-                )
-                for tool in self.tools.values()
-            ]
+            # The registry is fixed once registration finishes, so the
+            # descriptors are built on the first tools/list and reused.
+            if self._tool_list is None:
+                self._tool_list = [
+                    Tool(
+                        name=tool.schema["name"],
+                        description=tool.schema["description"],
+                        inputSchema=tool.schema["inputSchema"]
+                    )
+                    for tool in self.tools.values()
+                ]
+            return list(self._tool_list)
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict) -> list[TextContent]:
@@ -848,17 +859,16 @@ class EWSMCPServer:
         # Instantiate and register tools
         for tool_class in tool_classes:
             tool = tool_class(self.ews_client)
-            schema = tool.get_schema()
-            self.tools[schema["name"]] = tool
+            self.tools[tool.schema["name"]] = tool
 
         # ExecuteApprovedActionTool needs the tool registry, so wire it after
         # every other tool is in place. This is why it isn't in the block
         # above.
         if self.settings.enable_agent:
             executor = ExecuteApprovedActionTool(self.ews_client, self.tools)
-            executor_schema = executor.get_schema()
-            self.tools[executor_schema["name"]] = executor
+            self.tools[executor.schema["name"]] = executor
 
+        self._tool_list = None
         self.logger.info(f"Registered {len(self.tools)} tools: {', '.join(self.tools.keys())}")
 
         # Initialize OpenAPI adapter with settings for configurable URLs
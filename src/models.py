@@ -25,7 +25,7 @@ def _validate_loose_email(value: str) -> str:
     if not stripped or not _EMAIL_SYNTAX_RE.match(stripped):
         raise ValueError(f"email_address {value!r} is not a valid email syntax")
     return stripped
-from typing import Optional, List, Literal
+from typing import Optional, List, Literal, Union
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -216,6 +216,22 @@ class CreateTaskRequest(BaseModel):
     reminder_time: Optional[datetime] = Field(None, description="Reminder time")
 
 
+class UpdateTaskRequest(BaseModel):
+    """Request model for updating one or more tasks.
+
+    Only fields present in ``model_fields_set`` are written; an omitted
+    field is left untouched on the task.
+    """
+    item_id: Union[str, List[str]] = Field(..., description="Task item ID or list of IDs")
+    subject: Optional[str] = Field(None, description="New subject")
+    body: Optional[str] = Field(None, description="New body")
+    due_date: Optional[str] = Field(None, description="New due date")
+    percent_complete: Optional[int] = Field(None, ge=0, le=100, description="Percent complete")
+    importance: Optional[ImportanceLevel] = None
+    categories: Optional[List[str]] = Field(None, description="Replacement categories")
+    target_mailbox: Optional[str] = None
+
+
 class TaskDetails(BaseModel):
     """Task details model."""
     item_id: str
@@ -25,7 +25,7 @@ class OpenAPIAdapter:
         paths = {}
 
         for tool_name, tool in self.tools.items():
-            schema = tool.get_schema()
+            schema = tool.schema
 
             # Convert MCP tool schema to OpenAPI path
             path = f"/api/tools/{tool_name}"
@@ -1,6 +1,7 @@
 """EmailService - Email operations for EWS MCP v3.0."""
 
 import logging
+import os
 from typing import List, Optional
 from datetime import datetime
 
@@ -99,7 +100,7 @@ class EmailService:
                 for file_path in attachments:
                     with open(file_path, 'rb') as f:
                         content = f.read()
-                        filename = file_path.split('/')[-1]
+                        filename = os.path.basename(file_path)
                         attachment = FileAttachment(
                             name=filename,
                             content=content
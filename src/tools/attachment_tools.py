@@ -415,6 +415,8 @@ class DownloadAttachmentTool(BaseTool):
 class AddAttachmentTool(BaseTool):
     """Tool for adding attachments to draft or existing emails."""
 
+    mutates_mailbox = True
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "add_attachment",
@@ -567,6 +569,8 @@ class AddAttachmentTool(BaseTool):
 class DeleteAttachmentTool(BaseTool):
     """Tool for removing attachments from email messages."""
 
+    mutates_mailbox = True
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "delete_attachment",
@@ -1230,6 +1234,8 @@ class GetEmailMimeTool(BaseTool):
 class AttachEmailToDraftTool(BaseTool):
     """Tool for attaching an existing email as an embedded message to a draft."""
 
+    mutates_mailbox = True
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "attach_email_to_draft",
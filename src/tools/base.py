@@ -1,7 +1,7 @@
 """Base class for all MCP tools."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Type, Optional
+from typing import Any, Dict, Tuple, Type, Optional
 from pydantic import BaseModel, ValidationError as PydanticValidationError
 from exchangelib import Account
 import logging
@@ -17,6 +17,14 @@ from ..middleware.circuit_breaker import get_circuit_breaker
 class BaseTool(ABC):
     """Base class for all MCP tools with integrated logging."""
 
+    # Slotted so concrete tools that declare ``__slots__ = ()`` carry no
+    # per-instance ``__dict__``; ``_schema`` backs :attr:`schema`.
+    __slots__ = ("ews_client", "logger", "log_manager", "_schema")
+
+    # Tools that create, move, change or delete messages set this so
+    # safe_execute drops cached search_emails responses after each call.
+    mutates_mailbox: bool = False
+
     def __init__(self, ews_client: EWSClient):
         self.ews_client = ews_client
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -27,15 +35,28 @@ class BaseTool(ABC):
         """Return tool schema for MCP registration."""
         pass
 
+    @property
+    def schema(self) -> Dict[str, Any]:
+        """``get_schema()`` built once per tool instance. Treat as read-only."""
+        try:
+            return self._schema
+        except AttributeError:
+            self._schema = self.get_schema()
+            return self._schema
+
     @abstractmethod
     async def execute(self, **kwargs) -> Dict[str, Any]:
         """Execute tool operation."""
         pass
 
     def validate_input(self, model: Type[BaseModel], **kwargs) -> BaseModel:
-        """Validate input using Pydantic model. Returns human-readable errors."""
+        """Validate input using Pydantic model. Returns human-readable errors.
+
+        ``model_validate`` runs the model's class-level compiled validator
+        directly on the kwargs dict, without repacking it through ``__init__``.
+        """
         try:
-            return model(**kwargs)
+            return model.model_validate(kwargs)
         except PydanticValidationError as e:
             # Simplify Pydantic errors to single actionable lines
             errors = e.errors()
@@ -60,6 +81,14 @@ class BaseTool(ABC):
             return target_mailbox
         return self.ews_client.config.ews_email
 
+    def get_account_and_mailbox(self, target_mailbox: Optional[str] = None) -> Tuple[Account, str]:
+        """``(get_account(...), get_mailbox_info(...))`` in one call.
+
+        Accounts are already cached per mailbox by ``EWSClient``; this just
+        saves each tool the paired lookup boilerplate.
+        """
+        return self.get_account(target_mailbox), self.get_mailbox_info(target_mailbox)
+
     def get_memory_store(self):
         """Return the persistent memory store for the primary authenticated mailbox.
 
@@ -75,8 +104,19 @@ class BaseTool(ABC):
 
     async def safe_execute(self, **kwargs) -> Dict[str, Any]:
         """Execute with error handling, circuit breaker, and logging."""
+        try:
+            return await self._safe_execute(**kwargs)
+        finally:
+            if self.mutates_mailbox:
+                # Cleared on failure too: a partly applied batch still
+                # changed the mailbox.
+                from .email_tools import clear_search_cache
+                clear_search_cache()
+
+    async def _safe_execute(self, **kwargs) -> Dict[str, Any]:
+        """Body of :meth:`safe_execute`."""
         start_time = time.time()
-        tool_name = self.get_schema()["name"]
+        tool_name = self.schema["name"]
         module_name = self.__class__.__module__.split('.')[-1]
 
         # Circuit breaker check
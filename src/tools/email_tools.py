@@ -1,13 +1,23 @@
 """Email operation tools for EWS MCP Server."""
 
+import asyncio
+import copy
+import hashlib
+import json
 import logging
 import os
+import socket
+import time
 from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
+from types import MappingProxyType
 from exchangelib import Message, Mailbox, FileAttachment, HTMLBody, Body, Folder, ExtendedProperty
-from exchangelib.errors import ErrorTimeoutExpired
+from exchangelib.errors import ErrorTimeoutExpired, ErrorFolderNotFound, ErrorServerBusy
 from exchangelib.queryset import Q
+from tenacity import Retrying, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 # Define Flag as ExtendedProperty for setting email flag status
 # See: https://github.com/ecederstrand/exchangelib/issues/85
@@ -19,12 +29,14 @@ class FlagStatus(ExtendedProperty):
 # Register the flag property on Message class
 Message.register('flag_status_value', FlagStatus)
 
-# Mapping from string flag_status to integer values
-FLAG_STATUS_MAP = {
+# Mapping from string flag_status to integer values. Read-only view so no
+# caller can mutate the shared table at runtime.
+FLAG_STATUS_MAP = MappingProxyType({
     'NotFlagged': None,
     'Flagged': 2,
     'Complete': 1,
-}
+})
+_FLAG_KEYS_STR = ", ".join(FLAG_STATUS_MAP)
 import re
 
 from .base import BaseTool
@@ -36,9 +48,9 @@ from ..utils import (
     attach_inline_files, INLINE_ATTACHMENTS_SCHEMA,
     escape_html, format_body_for_html, sanitize_html,
     project_fields, ensure_snippet, strip_body_by_default, LIST_DEFAULT_FIELDS,
-    ews_call_log,
+    ews_call_log, ews_page_size, MAX_EWS_PAGE_SIZE, email_of, emails_of,
 )
-from .folder_tools import find_folder_by_id, get_standard_folder_map
+from .folder_tools import clear_folder_id_index, get_standard_folder_map, lookup_folder_by_id
 
 # v4.0 — bidirectional body format schema fragments (read + write)
 from ..body_format import (
@@ -107,6 +119,14 @@ _DB_FIELDS_BY_PUBLIC: Dict[str, tuple] = {
 }
 
 
+# Exchangelib DB fields read by ``ReadEmailsTool`` per item.
+_READ_EMAILS_DB_FIELDS: tuple = (
+    "id", "subject", "sender", "to_recipients", "cc_recipients",
+    "bcc_recipients", "datetime_received", "is_read", "has_attachments",
+    "text_body",
+)
+
+
 def _db_fields_for(public_fields: Optional[List[str]]) -> tuple:
     """Map public field names to the exchangelib DB-field tuple.
 
@@ -210,6 +230,39 @@ def _query_total(query: Any, logger: logging.Logger, folder_label: str) -> Optio
         return None
 
 
+
+# FindItem page retry: up to four attempts on timeouts and throttling,
+# with full-jitter exponential waits so concurrent searches that were
+# throttled together do not retry in lockstep.
+_PAGE_RETRY_ATTEMPTS = 4
+_PAGE_RETRY_JITTER = wait_random_exponential(multiplier=2, max=30)
+# Upper bound on an ErrorServerBusy back_off hint; the wait blocks a
+# worker thread.
+_PAGE_RETRY_MAX_BACK_OFF = 60.0
+
+
+def _page_retry_wait(retry_state: Any) -> float:
+    """Sleep for EWS's ``back_off`` hint on ErrorServerBusy, else jitter."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    back_off = getattr(exc, "back_off", None)
+    if isinstance(exc, ErrorServerBusy) and back_off:
+        return min(float(back_off), _PAGE_RETRY_MAX_BACK_OFF)
+    return _PAGE_RETRY_JITTER(retry_state)
+
+
+def _fetch_page(query: Any, start: int, stop: int) -> List[Any]:
+    """Materialise ``query[start:stop]``, retrying transient EWS failures."""
+    for attempt in Retrying(
+        stop=stop_after_attempt(_PAGE_RETRY_ATTEMPTS),
+        wait=_page_retry_wait,
+        retry=retry_if_exception_type((ErrorTimeoutExpired, socket.timeout, ErrorServerBusy)),
+        reraise=True,
+    ):
+        with attempt:
+            return list(query[start:stop])
+    return []
+
+
 def _paginate_query(
     query: Any,
     *,
@@ -222,7 +275,8 @@ def _paginate_query(
     """Materialise the query in explicit chunks, capturing partial-failure.
 
     * Walks ``query[o:o+chunk_size]`` slices in a for-loop, building up
-      to ``max_results`` items.
+      to ``max_results`` items. The queryset's ``page_size`` is set to
+      the chunk size so each slice is exactly one FindItem request.
     * Unwraps any mid-iteration exception into a classified error_code
       on the outcome — prior code swallowed these and returned partial
       results as "success".
@@ -234,11 +288,15 @@ def _paginate_query(
     target_offset = max(0, int(offset))
     remaining = max(0, int(max_results))
     cursor = target_offset
-    chunk_size = max(1, min(chunk_size, 250))
+    chunk_size = max(1, min(chunk_size, MAX_EWS_PAGE_SIZE))
+    try:
+        query.page_size = chunk_size
+    except Exception:
+        pass
     while remaining > 0:
         want = min(chunk_size, remaining)
         try:
-            batch = list(query[cursor:cursor + want])
+            batch = _fetch_page(query, cursor, cursor + want)
         except Exception as exc:
             code = _classify_ews_error(exc)
             # Log full type at WARNING so ops can catch the real cause
@@ -261,6 +319,33 @@ def _paginate_query(
     return outcome
 
 
+# Standard folders that ``search_scope`` may name in advanced/full_text mode.
+_SEARCH_SCOPE_FOLDERS = ("inbox", "sent", "drafts", "deleted", "junk")
+
+
+# Stand-in timestamp for items missing a date field. A fixed string, so
+# the per-item path neither allocates a datetime nor reports "now".
+_EPOCH_ISO = "1970-01-01T00:00:00+00:00"
+
+
+def _iso_or_epoch(item: Any, attr: str) -> str:
+    """ISO-8601 form of ``item.<attr>``, or ``_EPOCH_ISO`` when unset."""
+    dt = safe_get(item, attr, None)
+    return dt.isoformat() if dt else _EPOCH_ISO
+
+
+async def _resolve_list_folder(account, folder_name: str):
+    """Resolve a read/search folder, short-circuiting the standard names.
+
+    ``inbox``, ``sent`` etc. come straight from the per-account standard
+    folder map; anything else goes through ``resolve_folder_for_account``.
+    """
+    name = (folder_name or "").strip().lower()
+    if name in _SEARCH_SCOPE_FOLDERS:
+        return get_standard_folder_map(account)[name]
+    return await resolve_folder_for_account(account, folder_name)
+
+
 def _build_list_item(
     email: Any,
     *,
@@ -271,10 +356,7 @@ def _build_list_item(
 
     Pulled out of the three search paths so they share one shape.
     """
-    sender = safe_get(email, "sender", None)
-    from_email = ""
-    if sender and hasattr(sender, "email_address"):
-        from_email = sender.email_address or ""
+    from_email = email_of(safe_get(email, "sender", None))
     text_body = safe_get(email, "text_body", "") or ""
     received = safe_get(email, "datetime_received", None)
     received_iso = received.isoformat() if received and hasattr(received, "isoformat") else None
@@ -282,10 +364,7 @@ def _build_list_item(
         "message_id": ews_id_to_str(safe_get(email, "id", None)) or "",
         "subject": safe_get(email, "subject", "") or "",
         "from": from_email,
-        "to": [
-            r.email_address for r in (safe_get(email, "to_recipients", []) or [])
-            if hasattr(r, "email_address")
-        ],
+        "to": emails_of(email, "to_recipients"),
         "received_time": received_iso,
         "is_read": safe_get(email, "is_read", False),
         "has_attachments": safe_get(email, "has_attachments", False),
@@ -335,6 +414,12 @@ def extract_body_html(message) -> str:
     return strip_html_document_tags(html)
 
 
+_STYLE_BLOCK_RE = re.compile(r'<style[^>]*>.*?</style>', re.IGNORECASE | re.DOTALL)
+_MSO_COMMENT_RE = re.compile(r'<!--\[if[^\]]*\]>.*?<!\[endif\]-->', re.IGNORECASE | re.DOTALL)
+_HEAD_BLOCK_RE = re.compile(r'<head[^>]*>.*?</head>', re.IGNORECASE | re.DOTALL)
+_DOCUMENT_TAG_RE = re.compile(r'<!DOCTYPE[^>]*>|</?html[^>]*>|</?body[^>]*>', re.IGNORECASE)
+
+
 def strip_html_document_tags(html: str) -> str:
     """
     Strip document-level HTML tags from content while preserving styles.
@@ -354,23 +439,20 @@ def strip_html_document_tags(html: str) -> str:
     if not html:
         return html
 
+    # No markup at all (plain-text original): nothing to strip or preserve.
+    if '<' not in html:
+        return html.strip()
+
     # Extract <style> blocks to preserve them
-    style_blocks = re.findall(r'<style[^>]*>.*?</style>', html, flags=re.IGNORECASE | re.DOTALL)
+    style_blocks = _STYLE_BLOCK_RE.findall(html)
 
     # Extract MSO conditional comments (<!--[if gte mso 9]>...<![endif]-->)
-    mso_comments = re.findall(r'<!--\[if[^\]]*\]>.*?<!\[endif\]-->', html, flags=re.IGNORECASE | re.DOTALL)
+    mso_comments = _MSO_COMMENT_RE.findall(html)
 
-    # Remove DOCTYPE declaration
-    html = re.sub(r'<!DOCTYPE[^>]*>', '', html, flags=re.IGNORECASE)
-
-    # Remove <html> open/close tags (with any attributes)
-    html = re.sub(r'</?html[^>]*>', '', html, flags=re.IGNORECASE)
-
-    # Remove <head> tags but extract content we want to preserve
-    html = re.sub(r'<head[^>]*>.*?</head>', '', html, flags=re.IGNORECASE | re.DOTALL)
-
-    # Remove <body> open/close tags but keep the content inside
-    html = re.sub(r'</?body[^>]*>', '', html, flags=re.IGNORECASE)
+    # Remove <head> (and everything in it), then the DOCTYPE declaration and
+    # <html>/<body> open/close tags in one pass, keeping the body content.
+    html = _HEAD_BLOCK_RE.sub('', html)
+    html = _DOCUMENT_TAG_RE.sub('', html)
 
     # Prepend preserved styles and MSO comments
     preserved_content = '\n'.join(style_blocks + mso_comments)
@@ -435,6 +517,16 @@ def add_reply_prefix(subject: str) -> str:
     return f"RE: {stripped}"
 
 
+# ``class="WordSection1"`` in any of the quoting/spacing forms Outlook emits.
+# Group 1 is the quote character (empty when unquoted).
+_WORD_SECTION_CLASS_RE = re.compile(r"""class(?:=| = )(["']?)WordSection1\1""")
+
+
+def _original_section_class(match) -> str:
+    quote = match.group(1)
+    return f"class={quote}OriginalSection{quote}"
+
+
 def clean_original_body_for_signature(original_body_html: str) -> str:
     """
     Remove or rename WordSection1 from original content to prevent
@@ -453,16 +545,55 @@ def clean_original_body_for_signature(original_body_html: str) -> str:
     if not original_body_html:
         return original_body_html
 
-    # Rename WordSection1 to OriginalSection to avoid confusing Exclaimer
-    cleaned = original_body_html.replace('class="WordSection1"', 'class="OriginalSection"')
-    cleaned = cleaned.replace("class='WordSection1'", "class='OriginalSection'")
-    cleaned = cleaned.replace('class=WordSection1', 'class=OriginalSection')
+    # Most originals never carry the class; one substring scan settles it.
+    if 'WordSection1' not in original_body_html:
+        return original_body_html
+
+    # Rename WordSection1 to OriginalSection to avoid confusing Exclaimer.
+    # Single pass over the body covering class="…", class='…', class=…
+    # and the spaced ``class = "…"`` variants.
+    return _WORD_SECTION_CLASS_RE.sub(_original_section_class, original_body_html)
+
 
-    # Also handle variations with spaces
-    cleaned = cleaned.replace('class = "WordSection1"', 'class="OriginalSection"')
-    cleaned = cleaned.replace("class = 'WordSection1'", "class='OriginalSection'")
+# Any tag-shaped run; used to decide between HTMLBody and plain Body.
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
 
-    return cleaned
+# RFC 5322 "From" header value: group 1 is the optional display name
+# (everything before the first '<', quoted or escaped quotes included) and
+# group 2 the angle-bracketed address; group 3 is a bare address.
+_RFC_FROM_HEADER_RE = re.compile(
+    r'^\s*([^<]*?)\s*<([^>]+)>|^\s*([^\s<>]+@[^\s<>]+)\s*$'
+)
+
+# Outlook-style "Sent:" line, e.g. "Monday, May 04, 2026 09:15:00 AM".
+_FWD_DATE_FMT = '%A, %B %d, %Y %I:%M:%S %p'
+
+# Message attributes consulted, in priority order, for the forward/reply
+# "From:" line. Some are None for distribution lists and drafts.
+_SENDER_SOURCE_ATTRS = ("sender", "author", "from_")
+
+
+def _format_recipient(recipient) -> str:
+    """Render one Mailbox as ``Name <email>``, bare email, or bare name."""
+    if not recipient:
+        return ""
+    # Use 'or ""' to convert None to empty string
+    name = getattr(recipient, "name", "") or ""
+    email = getattr(recipient, "email_address", "") or ""
+    if name and email:
+        return f"{name} <{email}>"
+    return email or name
+
+
+def format_recipients(recipients) -> str:
+    """Join recipients into the ``'; '``-separated Outlook header form.
+
+    Returns raw text; callers escape once before HTML interpolation.
+    Recipients with neither a name nor an address are skipped.
+    """
+    if not recipients:
+        return ""
+    return '; '.join(filter(None, map(_format_recipient, recipients)))
 
 
 def format_forward_header(message) -> dict:
@@ -484,29 +615,21 @@ def format_forward_header(message) -> dict:
     sender_name = ""
     sender_email = ""
 
-    # Try sender first (most common)
-    sender = safe_get(message, "sender", None)
-    if sender:
-        sender_name = (sender.name or "") if hasattr(sender, "name") else ""
-        sender_email = (sender.email_address or "") if hasattr(sender, "email_address") else ""
-
-    # Fallback 1: Try author if sender.email_address is empty
-    if not sender_email:
-        author = safe_get(message, "author", None)
-        if author:
-            if not sender_name:
-                sender_name = (author.name or "") if hasattr(author, "name") else ""
-            sender_email = (author.email_address or "") if hasattr(author, "email_address") else ""
-
-    # Fallback 2: Try from_ if still empty
-    if not sender_email:
-        from_field = safe_get(message, "from_", None)
-        if from_field:
-            if not sender_name:
-                sender_name = (from_field.name or "") if hasattr(from_field, "name") else ""
-            sender_email = (from_field.email_address or "") if hasattr(from_field, "email_address") else ""
+    # Try sender first (most common), then author, then from_. Stop at the
+    # first source that yields an address; a display name found earlier in
+    # the chain is kept even when its address was empty.
+    for attr in _SENDER_SOURCE_ATTRS:
+        source = safe_get(message, attr, None)
+        if not source:
+            continue
+        if not sender_name:
+            sender_name = getattr(source, "name", "") or ""
+        if not sender_email:
+            sender_email = getattr(source, "email_address", "") or ""
+        if sender_email:
+            break
 
-    # Fallback 3: Extract from internet_message_headers as last resort
+    # Fallback: Extract from internet_message_headers as last resort
     if not sender_email:
         headers = safe_get(message, "headers", None) or safe_get(message, "internet_message_headers", None)
         if headers:
@@ -514,15 +637,15 @@ def format_forward_header(message) -> dict:
                 header_name = getattr(h, 'name', '') or ''
                 if header_name.lower() == 'from':
                     header_value = getattr(h, 'value', '') or ''
-                    # Parse "Name <email>" format
-                    match = re.search(r'<([^>]+)>', header_value)
-                    if match:
-                        sender_email = match.group(1)
+                    # Parse "Name <email>" or a bare address in one match
+                    match = _RFC_FROM_HEADER_RE.match(header_value)
+                    if match and match.group(2):
+                        sender_email = match.group(2)
                         # Also extract name if we don't have it
-                        if not sender_name:
-                            name_part = header_value[:header_value.find('<')].strip()
-                            if name_part:
-                                sender_name = name_part.strip('"\'')
+                        if not sender_name and match.group(1):
+                            sender_name = match.group(1).strip('"\'')
+                    elif match:
+                        sender_email = match.group(3)
                     elif '@' in header_value:
                         sender_email = header_value.strip()
                     break
@@ -542,24 +665,6 @@ def format_forward_header(message) -> dict:
         from_str = ""
 
     # To/Cc: same convention — raw text, single escape happens at the call site.
-    def format_recipients(recipients):
-        if not recipients:
-            return ""
-        parts = []
-        for r in recipients:
-            if not r:
-                continue
-            # Use 'or ""' to convert None to empty string
-            name = (r.name or "") if hasattr(r, "name") else ""
-            email = (r.email_address or "") if hasattr(r, "email_address") else ""
-            if name and email:
-                parts.append(f"{name} <{email}>")
-            elif email:
-                parts.append(email)
-            elif name:
-                parts.append(name)
-        return '; '.join(parts)
-
     to_recipients = safe_get(message, "to_recipients", []) or []
     cc_recipients = safe_get(message, "cc_recipients", []) or []
 
@@ -570,7 +675,7 @@ def format_forward_header(message) -> dict:
     sent_date = safe_get(message, "datetime_sent", None)
     date_str = ""
     if sent_date:
-        date_str = sent_date.strftime('%A, %B %d, %Y %I:%M:%S %p')
+        date_str = f"{sent_date:{_FWD_DATE_FMT}}"
 
     return {
         'from': from_str,
@@ -597,7 +702,8 @@ def copy_attachments_to_message(original_message, new_message) -> tuple:
     """
     # Check if target message supports attach method
     # ReplyToItem/ReplyAllToItem objects from create_reply() don't support attach
-    if not hasattr(new_message, 'attach') or not callable(getattr(new_message, 'attach', None)):
+    attach = getattr(new_message, 'attach', None)
+    if not callable(attach):
         return 0, 0
 
     attachments = safe_get(original_message, "attachments", []) or []
@@ -615,16 +721,17 @@ def copy_attachments_to_message(original_message, new_message) -> tuple:
             # Create new attachment preserving ALL properties
             # CRITICAL: content_id is needed for cid: references in HTML
             # CRITICAL: is_inline marks the attachment as embedded
+            is_inline = getattr(att, 'is_inline', False)
             new_att = FileAttachment(
                 name=att.name,
                 content=att.content,
                 content_type=getattr(att, 'content_type', None),
                 content_id=getattr(att, 'content_id', None),  # Preserve for cid: refs
-                is_inline=getattr(att, 'is_inline', False)     # Preserve inline flag
+                is_inline=is_inline                             # Preserve inline flag
             )
-            new_message.attach(new_att)
+            attach(new_att)
 
-            if getattr(att, 'is_inline', False):
+            if is_inline:
                 inline_count += 1
             else:
                 regular_count += 1
@@ -661,6 +768,38 @@ def is_exchange_folder_id(identifier: str) -> bool:
     return False
 
 
+# Resolved-folder cache. Custom names and paths are resolved by walking the
+# folder tree, which costs one or more FindFolder round-trips per level;
+# clients tend to hit the same few folders repeatedly within a session.
+# Keyed by (mailbox, identifier) -> (time.monotonic() when stored, folder).
+# Failures are never cached, so a ToolExecutionError is retried next call.
+_FOLDER_RESOLVE_CACHE: Dict[tuple, tuple] = {}
+_FOLDER_RESOLVE_TTL_SECONDS = 300.0
+_FOLDER_RESOLVE_CACHE_MAX = 512
+
+
+def _folder_cache_key(account, folder_identifier: str) -> tuple:
+    """Build the cache key. Names are case-insensitive; IDs are not."""
+    mailbox = (safe_get(account, "primary_smtp_address", "") or "").lower()
+    if is_exchange_folder_id(folder_identifier):
+        return (mailbox, folder_identifier)
+    return (mailbox, folder_identifier.lower())
+
+
+def evict_folder_cache(account, folder_identifier: str) -> None:
+    """Forget one cached resolution, e.g. after EWS reports it is gone."""
+    _FOLDER_RESOLVE_CACHE.pop(
+        _folder_cache_key(account, (folder_identifier or "").strip()), None
+    )
+    clear_folder_id_index(account)
+
+
+def clear_folder_cache() -> None:
+    """Drop every cached folder resolution (e.g. after a folder rename)."""
+    _FOLDER_RESOLVE_CACHE.clear()
+    clear_folder_id_index()
+
+
 async def resolve_folder_for_account(account, folder_identifier: str):
     """
     Resolve folder from name, path, or ID for a specific account.
@@ -671,12 +810,36 @@ async def resolve_folder_for_account(account, folder_identifier: str):
     - Folder IDs: AAMkADc3MWUy... (base64 encoded, may contain '/' characters)
     - Custom folder names: CC, Archive, Projects
 
+    Successful resolutions are memoised per mailbox for
+    ``_FOLDER_RESOLVE_TTL_SECONDS``.
+
     Args:
         account: Exchange Account object (primary or impersonated)
         folder_identifier: Folder name, path, or ID
     """
     folder_identifier = folder_identifier.strip()
-
+    key = _folder_cache_key(account, folder_identifier)
+    now = time.monotonic()
+    cached = _FOLDER_RESOLVE_CACHE.get(key)
+    if cached is not None and now - cached[0] < _FOLDER_RESOLVE_TTL_SECONDS:
+        return cached[1]
+
+    folder = _resolve_folder_uncached(account, folder_identifier)
+
+    if len(_FOLDER_RESOLVE_CACHE) >= _FOLDER_RESOLVE_CACHE_MAX:
+        for stale_key in [
+            k for k, (stored_at, _) in _FOLDER_RESOLVE_CACHE.items()
+            if now - stored_at >= _FOLDER_RESOLVE_TTL_SECONDS
+        ]:
+            _FOLDER_RESOLVE_CACHE.pop(stale_key, None)
+        if len(_FOLDER_RESOLVE_CACHE) >= _FOLDER_RESOLVE_CACHE_MAX:
+            _FOLDER_RESOLVE_CACHE.clear()
+    _FOLDER_RESOLVE_CACHE[key] = (now, folder)
+    return folder
+
+
+def _resolve_folder_uncached(account, folder_identifier: str):
+    """Walk the standard map / ID / path / name strategies in order."""
     folder_map = get_standard_folder_map(account)
     folder_map["trash"] = account.trash
 
@@ -712,7 +875,7 @@ async def resolve_folder_for_account(account, folder_identifier: str):
     # Try 2: Folder ID (starts with AAMk or similar Exchange ID pattern)
     # IMPORTANT: Check this BEFORE path parsing, as base64 IDs can contain '/'
     if is_exchange_folder_id(folder_identifier):
-        found_folder = find_folder_by_id(account.root, folder_identifier)
+        found_folder = lookup_folder_by_id(account, folder_identifier)
         if found_folder:
             return found_folder
         # If not found as folder ID, don't fall through to path parsing
@@ -796,6 +959,8 @@ async def resolve_folder(ews_client, folder_identifier: str):
 class SendEmailTool(BaseTool):
     """Tool for sending emails."""
 
+    mutates_mailbox = True
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "send_email",
@@ -891,7 +1056,9 @@ class SendEmailTool(BaseTool):
                 raise ToolExecutionError("Email body is empty after processing")
 
             # Detect if body is HTML or plain text
-            is_html = bool(re.search(r'<[^>]+>', email_body))  # Check for HTML tags
+            # Check for HTML tags. The '<' containment test is a single
+            # memchr and rejects plain-text bodies before the regex runs.
+            is_html = '<' in email_body and _HTML_TAG_RE.search(email_body) is not None
 
             # Log body details for debugging
             body_type = "HTML" if is_html else "Plain Text"
@@ -930,12 +1097,15 @@ class SendEmailTool(BaseTool):
             message.importance = request.importance.value
 
             # CRITICAL: Verify body was set correctly BEFORE attaching/sending
-            if not message.body or len(str(message.body).strip()) == 0:
+            # Body/HTMLBody subclass str, so check it in place rather than
+            # copying it with str() just to measure it.
+            set_body = message.body
+            if not set_body or set_body.isspace():
                 raise ToolExecutionError(
                     f"Message body is empty after creation! Original body length: {len(email_body)}, "
-                    f"Message body: {message.body}"
+                    f"Message body: {set_body}"
                 )
-            self.logger.info(f"Verified message body set correctly: {len(str(message.body))} characters")
+            self.logger.info(f"Verified message body set correctly: {len(set_body)} characters")
 
             # Add attachments if provided
             attachment_count = 0
@@ -997,8 +1167,9 @@ class SendEmailTool(BaseTool):
             self.logger.info(f"Message sent to {', '.join(request.to)} with {attachment_count} attachment(s)")
 
             # FINAL VERIFICATION: Check message body after send
-            if hasattr(message, 'body') and message.body and len(str(message.body).strip()) > 0:
-                body_length = len(str(message.body))
+            sent_body = getattr(message, 'body', None)
+            if sent_body and not sent_body.isspace():
+                body_length = len(sent_body)
                 self.logger.info(f"✅ SUCCESS: Email sent with body content ({body_length} characters)")
             else:
                 # This should not happen, but if it does, it's critical to know
@@ -1022,6 +1193,25 @@ class SendEmailTool(BaseTool):
             raise ToolExecutionError(f"Failed to send email: {e}")
 
 
+def _read_emails_item(item: Any) -> Dict[str, Any]:
+    """Build one ``read_emails`` result dict from a projected Message."""
+    from_email = email_of(safe_get(item, "sender", None))
+
+    return {
+        "message_id": ews_id_to_str(safe_get(item, "id", None)) or "unknown",
+        "subject": safe_get(item, "subject", "") or "",
+        "from": from_email,
+        "to": emails_of(item, "to_recipients"),
+        "cc": emails_of(item, "cc_recipients"),
+        "bcc": emails_of(item, "bcc_recipients"),
+        "received_time": _iso_or_epoch(item, "datetime_received"),
+        "is_read": safe_get(item, "is_read", False),
+        "has_attachments": safe_get(item, "has_attachments", False),
+        # Only the preview survives; the full text body is not kept.
+        "preview": truncate_text(safe_get(item, "text_body", "") or "", 200),
+    }
+
+
 class ReadEmailsTool(BaseTool):
     """Tool for reading emails from inbox."""
 
@@ -1074,7 +1264,7 @@ class ReadEmailsTool(BaseTool):
             mailbox = self.get_mailbox_info(target_mailbox)
 
             # Get folder - supports standard names, paths, and folder IDs
-            folder = await resolve_folder_for_account(account, folder_name)
+            folder = await _resolve_list_folder(account, folder_name)
             self.logger.info(f"Resolved folder '{folder_name}' to: {safe_get(folder, 'name', folder_name)} in mailbox: {mailbox}")
 
             # Build query
@@ -1083,31 +1273,30 @@ class ReadEmailsTool(BaseTool):
             if unread_only:
                 items = items.filter(is_read=False)
 
-            # Fetch emails
-            emails = []
-            for item in items[:max_results]:
-                # Get sender email safely
-                sender = safe_get(item, "sender", None)
-                from_email = ""
-                if sender and hasattr(sender, "email_address"):
-                    from_email = sender.email_address or ""
-
-                # Get text body safely
-                text_body = safe_get(item, "text_body", "") or ""
-
-                email_data = {
-                    "message_id": ews_id_to_str(safe_get(item, "id", None)) or "unknown",
-                    "subject": safe_get(item, "subject", "") or "",
-                    "from": from_email,
-                    "to": [r.email_address for r in (safe_get(item, "to_recipients", []) or []) if r and hasattr(r, "email_address") and r.email_address],
-                    "cc": [r.email_address for r in (safe_get(item, "cc_recipients", []) or []) if r and hasattr(r, "email_address") and r.email_address],
-                    "bcc": [r.email_address for r in (safe_get(item, "bcc_recipients", []) or []) if r and hasattr(r, "email_address") and r.email_address],
-                    "received_time": safe_get(item, "datetime_received", datetime.now()).isoformat(),
-                    "is_read": safe_get(item, "is_read", False),
-                    "has_attachments": safe_get(item, "has_attachments", False),
-                    "preview": truncate_text(text_body, 200)
-                }
-                emails.append(email_data)
+            # Only fetch the properties the item dict below reads; without
+            # this exchangelib pulls every property, HTML body included.
+            try:
+                items = items.only(*_READ_EMAILS_DB_FIELDS)
+            except Exception as only_exc:
+                self.logger.debug(
+                    "query.only(%s) rejected: %s", _READ_EMAILS_DB_FIELDS, only_exc,
+                )
+
+            # One FindItem page for the whole request where possible.
+            try:
+                items.page_size = max(1, min(max_results, ews_page_size(self.ews_client)))
+            except Exception:
+                pass
+
+            # Fetch and convert in one worker-thread pass. Iterating the
+            # query lazily lets each Message (and its text body) be dropped
+            # as soon as its dict is built, instead of holding the whole
+            # page of Messages alongside the finished dicts. islice stops
+            # pulling pages the moment max_results items have been seen.
+            def _collect() -> List[Dict[str, Any]]:
+                return [_read_emails_item(item) for item in islice(items, max_results)]
+
+            emails = await asyncio.to_thread(_collect)
 
             self.logger.info(f"Retrieved {len(emails)} emails from {folder_name} in mailbox: {mailbox}")
 
@@ -1119,11 +1308,88 @@ class ReadEmailsTool(BaseTool):
                 mailbox=mailbox
             )
 
+        except ErrorFolderNotFound as e:
+            # The cached handle outlived the folder (deleted or moved from
+            # another client). Drop it so the next call re-resolves.
+            evict_folder_cache(account, folder_name)
+            self.logger.error(f"Failed to read emails: {e}")
+            raise ToolExecutionError(f"Failed to read emails: {e}")
         except Exception as e:
             self.logger.error(f"Failed to read emails: {e}")
             raise ToolExecutionError(f"Failed to read emails: {e}")
 
 
+# ---------------------------------------------------------------------------
+# search_emails result cache
+# ---------------------------------------------------------------------------
+#
+# LLM callers routinely re-issue an identical search within seconds. Whole
+# responses are cached per canonicalised kwargs for SEARCH_CACHE_TTL
+# seconds (0, the default, disables). Every tool flagged
+# ``mutates_mailbox`` clears the cache when it runs (BaseTool.safe_execute).
+_SEARCH_CACHE: Dict[bytes, tuple] = {}
+_SEARCH_CACHE_MAX = 256
+# Params that shape the response without narrowing the query. A call made
+# of these alone gets the rolling "last 30 days" window, so it is never
+# cached.
+_SEARCH_UNBOUNDED_PARAMS = frozenset({
+    "mode", "target_mailbox", "folder", "search_scope",
+    "max_results", "offset", "fields", "sort_by", "sort_order",
+})
+
+
+def _search_cache_ttl(ews_client: Any) -> int:
+    """Configured ``SEARCH_CACHE_TTL``; 0 when caching is disabled."""
+    config = getattr(ews_client, "config", None)
+    if not getattr(config, "enable_cache", True):
+        return 0
+    return int(getattr(config, "search_cache_ttl", 0) or 0)
+
+
+def _search_cache_key(kwargs: Dict[str, Any]) -> Optional[bytes]:
+    """Digest of the search kwargs, or None when the call is uncacheable."""
+    canonical = {k: v for k, v in kwargs.items() if v is not None}
+    if not set(canonical) - _SEARCH_UNBOUNDED_PARAMS:
+        return None
+    mailbox = canonical.get("target_mailbox")
+    if isinstance(mailbox, str):
+        canonical["target_mailbox"] = mailbox.lower()
+    payload = json.dumps(canonical, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+
+def _split_mailboxes(target_mailbox: Any) -> List[str]:
+    """Normalise ``target_mailbox`` (str, comma list or list) to addresses."""
+    if not target_mailbox:
+        return []
+    if isinstance(target_mailbox, str):
+        target_mailbox = target_mailbox.split(",")
+    seen: Dict[str, str] = {}
+    for mb in target_mailbox:
+        mb = str(mb or "").strip()
+        if mb and mb.lower() not in seen:
+            seen[mb.lower()] = mb
+    return list(seen.values())
+
+
+# sort_by value -> list-item key the multi-mailbox merge sorts on. Items
+# carry no sent time, so datetime_sent merges on received_time.
+_MERGE_SORT_KEYS = {
+    "datetime_received": "received_time",
+    "datetime_sent": "received_time",
+    "from": "from",
+    "subject": "subject",
+    "importance": "importance",
+}
+
+
+def clear_search_cache() -> None:
+    """Drop every cached search response (after a mailbox mutation)."""
+    _SEARCH_CACHE.clear()
+    # A moved/deleted/updated message must not be quoted from a stale copy.
+    _ORIGINAL_MESSAGE_CACHE.clear()
+
+
 class SearchEmailsTool(BaseTool):
     """Unified email search tool with quick/advanced/full_text modes."""
 
@@ -1271,8 +1537,11 @@ class SearchEmailsTool(BaseTool):
                         "default": False
                     },
                     "target_mailbox": {
-                        "type": "string",
-                        "description": "Email address to search in (requires impersonation/delegate access)"
+                        "oneOf": [
+                            {"type": "string"},
+                            {"type": "array", "items": {"type": "string"}},
+                        ],
+                        "description": "Email address to search in (requires impersonation/delegate access). A list or comma-separated string searches several mailboxes concurrently and merges the results newest-first."
                     }
                 }
             }
@@ -1326,16 +1595,146 @@ class SearchEmailsTool(BaseTool):
         )
 
     async def execute(self, **kwargs) -> Dict[str, Any]:
-        """Route to appropriate search mode."""
+        """Route to appropriate search mode, serving repeats from cache."""
         self._validate_kwargs(kwargs)
-        mode = kwargs.get("mode", "quick")
 
+        mailboxes = _split_mailboxes(kwargs.get("target_mailbox"))
+        if len(mailboxes) > 1:
+            return await self._search_mailboxes(mailboxes, kwargs)
+        kwargs["target_mailbox"] = mailboxes[0] if mailboxes else None
+
+        ttl = _search_cache_ttl(self.ews_client)
+        cache_key = _search_cache_key(kwargs) if ttl > 0 else None
+        now = time.monotonic()
+        if cache_key is not None:
+            cached = _SEARCH_CACHE.get(cache_key)
+            if cached is not None and now - cached[0] < ttl:
+                return copy.deepcopy(cached[1])
+
+        mode = kwargs.get("mode", "quick")
         if mode == "advanced":
-            return await self._search_advanced(**kwargs)
+            result = await self._search_advanced(**kwargs)
         elif mode == "full_text":
-            return await self._search_full_text(**kwargs)
+            result = await self._search_full_text(**kwargs)
         else:
-            return await self._search_quick(**kwargs)
+            result = await self._search_quick(**kwargs)
+
+        # Partial results (meta.error_code, or per_folder_errors from the
+        # advanced/full_text paths) are not worth replaying.
+        meta = result.get("meta") or {}
+        if (
+            cache_key is not None
+            and not meta.get("error_code")
+            and not meta.get("per_folder_errors")
+        ):
+            # Expired responses are dropped on every store so they never
+            # linger in memory until the cache happens to fill up.
+            for stale_key in [
+                k for k, (stored_at, _) in _SEARCH_CACHE.items()
+                if now - stored_at >= ttl
+            ]:
+                _SEARCH_CACHE.pop(stale_key, None)
+            if len(_SEARCH_CACHE) >= _SEARCH_CACHE_MAX:
+                _SEARCH_CACHE.clear()
+            _SEARCH_CACHE[cache_key] = (now, copy.deepcopy(result))
+        return result
+
+    async def _search_mailboxes(
+        self, mailboxes: List[str], kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Run one search per mailbox concurrently and merge the items.
+
+        Each mailbox goes through :meth:`execute`, so per-mailbox results
+        are cached individually. Each mailbox's ``meta`` (per-folder errors,
+        partial-result markers) and ``total_available`` are kept under
+        ``meta.per_mailbox``. A mailbox that fails is reported under
+        ``meta.per_mailbox_errors``; the call only fails if all of them do.
+        ``offset`` is rejected: per-mailbox offsets cannot page a merged list.
+        """
+        if kwargs.get("offset"):
+            raise ValidationError(
+                "offset is not supported when target_mailbox lists several "
+                "mailboxes; raise max_results or search one mailbox at a time."
+            )
+
+        # Merge order: advanced mode honours sort_by/sort_order; the other
+        # modes return newest first.
+        if kwargs.get("mode") == "advanced":
+            sort_key = _MERGE_SORT_KEYS.get(
+                kwargs.get("sort_by") or "datetime_received", "received_time"
+            )
+            reverse = (kwargs.get("sort_order") or "descending") == "descending"
+        else:
+            sort_key, reverse = "received_time", True
+
+        # The sort field must survive a ``fields`` projection to merge on
+        # it; it is stripped again below when the caller did not ask for it.
+        fields = kwargs.get("fields")
+        strip_sort_key = bool(fields) and sort_key not in fields
+        mailbox_kwargs = dict(kwargs)
+        if strip_sort_key:
+            mailbox_kwargs["fields"] = list(fields) + [sort_key]
+
+        results = await asyncio.gather(
+            *(self.execute(**{**mailbox_kwargs, "target_mailbox": mb}) for mb in mailboxes),
+            return_exceptions=True,
+        )
+
+        items: List[Dict[str, Any]] = []
+        per_mailbox: Dict[str, Dict[str, Any]] = {}
+        per_mailbox_errors: List[Dict[str, Any]] = []
+        total_available: Optional[int] = 0
+        for mb, result in zip(mailboxes, results):
+            if isinstance(result, ValidationError):
+                raise result
+            if isinstance(result, BaseException):
+                per_mailbox_errors.append({"mailbox": mb, "error": str(result)})
+                total_available = None
+                continue
+            mailbox_total = result.get("total_available")
+            per_mailbox[mb] = {
+                "count": result.get("count", 0),
+                "total_available": mailbox_total,
+                **(result.get("meta") or {}),
+            }
+            if total_available is not None:
+                total_available = (
+                    total_available + mailbox_total if mailbox_total is not None else None
+                )
+            for item in result.get("items") or []:
+                item.setdefault("mailbox", mb)
+                items.append(item)
+
+        if len(per_mailbox_errors) == len(mailboxes):
+            raise ToolExecutionError(
+                f"Failed to search emails: {per_mailbox_errors[0]['error']}"
+            )
+
+        # ISO-8601 strings sort chronologically; items without the sort
+        # field sort as "".
+        items.sort(key=lambda i: str(i.get(sort_key) or ""), reverse=reverse)
+        max_results = kwargs.get("max_results")
+        if max_results:
+            items = items[:max_results]
+        if strip_sort_key:
+            for item in items:
+                item.pop(sort_key, None)
+
+        meta: Dict[str, Any] = {"per_mailbox": per_mailbox}
+        if per_mailbox_errors:
+            meta["per_mailbox_errors"] = per_mailbox_errors
+        response: Dict[str, Any] = {
+            "items": items,
+            "count": len(items),
+            "total_available": total_available,
+            "mailboxes": mailboxes,
+            "meta": meta,
+        }
+
+        return format_success_response(
+            f"Found {len(items)} matching emails across {len(mailboxes)} mailboxes",
+            **response,
+        )
 
     async def _search_quick(self, **kwargs) -> Dict[str, Any]:
         """Quick search: filter by subject, sender, date, read status, attachments.
@@ -1345,9 +1744,6 @@ class SearchEmailsTool(BaseTool):
         ``to_address``) — the schema previously advertised both spellings
         but only the ``*_address`` forms were wired up.
         """
-        from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-        import socket
-
         target_mailbox = kwargs.get("target_mailbox")
 
         # Normalise aliases so the rest of the function only has to check
@@ -1387,27 +1783,28 @@ class SearchEmailsTool(BaseTool):
                     )
 
             folder_name = kwargs.get("folder", "inbox")
-            folder = await resolve_folder_for_account(account, folder_name)
-
-            query = folder.all()
+            folder = await _resolve_list_folder(account, folder_name)
 
+            # Collect every predicate and apply one combined Q, as advanced
+            # mode does, rather than re-chaining ``.filter`` per condition.
+            q_filters = []
             if subject_contains:
-                query = query.filter(subject__contains=subject_contains)
+                q_filters.append(Q(subject__contains=subject_contains))
             if body_contains:
-                query = query.filter(body__contains=body_contains)
+                q_filters.append(Q(body__contains=body_contains))
             # `query` is a free-text parameter: subject OR body substring.
             if free_text:
-                query = query.filter(
+                q_filters.append(
                     Q(subject__contains=free_text) | Q(body__contains=free_text)
                 )
             if from_address:
-                query = query.filter(sender=from_address)
+                q_filters.append(Q(sender=from_address))
             if to_address:
-                query = query.filter(to_recipients__contains=to_address)
+                q_filters.append(Q(to_recipients__contains=to_address))
             if kwargs.get("has_attachments") is not None:
-                query = query.filter(has_attachments=kwargs["has_attachments"])
+                q_filters.append(Q(has_attachments=kwargs["has_attachments"]))
             if kwargs.get("is_read") is not None:
-                query = query.filter(is_read=kwargs["is_read"])
+                q_filters.append(Q(is_read=kwargs["is_read"]))
             if kwargs.get("is_flagged") is not None:
                 # Issue #115: filter on the PR_FLAG_STATUS extended property.
                 # The ``flag_status_value`` field is registered on Message at
@@ -1415,20 +1812,26 @@ class SearchEmailsTool(BaseTool):
                 # as an integer (None=unflagged, 1=complete, 2=flagged).
                 # Map the boolean accordingly.
                 if kwargs["is_flagged"]:
-                    query = query.filter(flag_status_value=2)
+                    q_filters.append(Q(flag_status_value=2))
                 else:
-                    # Unflagged includes both None and 1 (Complete). EWS
-                    # filter syntax can't OR null-or-1 cleanly without a Q,
-                    # so we exclude the flagged value instead.
-                    query = query.exclude(flag_status_value=2)
+                    # Unflagged includes both None and 1 (Complete); negate
+                    # the flagged value rather than OR-ing null-or-1.
+                    q_filters.append(~Q(flag_status_value=2))
             if kwargs.get("importance"):
-                query = query.filter(importance=kwargs["importance"])
+                q_filters.append(Q(importance=kwargs["importance"]))
             if kwargs.get("start_date"):
                 start = parse_datetime_tz_aware(kwargs["start_date"])
-                query = query.filter(datetime_received__gte=start)
+                q_filters.append(Q(datetime_received__gte=start))
             if kwargs.get("end_date"):
                 end = parse_datetime_tz_aware(kwargs["end_date"])
-                query = query.filter(datetime_received__lte=end)
+                q_filters.append(Q(datetime_received__lte=end))
+
+            query = folder.all()
+            if q_filters:
+                combined_filter = q_filters[0]
+                for q_filter in q_filters[1:]:
+                    combined_filter &= q_filter
+                query = query.filter(combined_filter)
 
             query = query.order_by('-datetime_received')
             max_results = kwargs.get("max_results", 50)
@@ -1449,19 +1852,26 @@ class SearchEmailsTool(BaseTool):
 
             folder_label = safe_get(folder, "name", "inbox")
             start_time = datetime.now()
-            outcome = _paginate_query(
-                query,
-                max_results=max_results,
-                offset=offset,
-                chunk_size=50,
-                logger=self.logger,
-                folder_label=folder_label,
-            )
+            page_size = ews_page_size(self.ews_client)
+
+            def _run_query():
+                # FindItem paging and item -> dict building are blocking;
+                # keep both off the event loop so other tools stay live.
+                result = _paginate_query(
+                    query,
+                    max_results=max_results,
+                    offset=offset,
+                    chunk_size=page_size,
+                    logger=self.logger,
+                    folder_label=folder_label,
+                )
+                built = [
+                    _build_list_item(e, fields=fields, folder_name=folder_label)
+                    for e in result.items
+                ]
+                return result, built
 
-            emails: List[Dict[str, Any]] = [
-                _build_list_item(e, fields=fields, folder_name=folder_label)
-                for e in outcome.items
-            ]
+            outcome, emails = await asyncio.to_thread(_run_query)
             duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
             ews_call_log(
                 self.logger, "FindItem",
@@ -1473,6 +1883,8 @@ class SearchEmailsTool(BaseTool):
                 outcome="ok" if outcome.error_code is None else outcome.error_code,
                 extra_fields={"tool": "search_emails.quick"},
             )
+            if (outcome.error_message or "").startswith("ErrorFolderNotFound"):
+                evict_folder_cache(account, folder_name)
 
             response: Dict[str, Any] = {
                 "items": emails,
@@ -1519,13 +1931,8 @@ class SearchEmailsTool(BaseTool):
             account = self.get_account(target_mailbox)
             mailbox = self.get_mailbox_info(target_mailbox)
 
-            folder_map = {
-                "inbox": account.inbox,
-                "sent": account.sent,
-                "drafts": account.drafts,
-                "deleted": account.trash,
-                "junk": account.junk
-            }
+            standard_folders = get_standard_folder_map(account)
+            folder_map = {name: standard_folders[name] for name in _SEARCH_SCOPE_FOLDERS}
 
             folders = []
             for folder_name in search_scope:
@@ -1628,11 +2035,12 @@ class SearchEmailsTool(BaseTool):
                     some_total_unknown = True
                     continue
 
-                outcome = _paginate_query(
+                outcome = await asyncio.to_thread(
+                    _paginate_query,
                     query,
                     max_results=per_folder_budget,
                     offset=offset,
-                    chunk_size=50,
+                    chunk_size=ews_page_size(self.ews_client),
                     logger=self.logger,
                     folder_label=folder_name,
                 )
@@ -1751,13 +2159,8 @@ class SearchEmailsTool(BaseTool):
 
             search_query = query_text.lower()
 
-            folder_map = {
-                "inbox": account.inbox,
-                "sent": account.sent,
-                "drafts": account.drafts,
-                "deleted": account.trash,
-                "junk": account.junk
-            }
+            standard_folders = get_standard_folder_map(account)
+            folder_map = {name: standard_folders[name] for name in _SEARCH_SCOPE_FOLDERS}
 
             folders_to_search = []
             for folder_name in search_scope:
@@ -1814,11 +2217,12 @@ class SearchEmailsTool(BaseTool):
                     some_total_unknown = True
                     continue
 
-                outcome = _paginate_query(
+                outcome = await asyncio.to_thread(
+                    _paginate_query,
                     query,
                     max_results=max_results,
                     offset=offset,
-                    chunk_size=50,
+                    chunk_size=ews_page_size(self.ews_client),
                     logger=self.logger,
                     folder_label=folder_name,
                 )
@@ -1911,6 +2315,30 @@ class SearchEmailsTool(BaseTool):
             )
 
 
+# Properties get_email_details always reads; the body fields are added
+# per request by ``_email_details_fields``.
+_EMAIL_DETAILS_DB_FIELDS = (
+    "subject", "sender", "to_recipients", "cc_recipients", "attachments",
+    "datetime_received", "datetime_sent", "is_read", "has_attachments",
+    "importance",
+)
+
+
+def _email_details_fields(fmt: str, include_body: bool) -> tuple:
+    """Fields to load for get_email_details given the requested body format.
+
+    html needs only ``body`` and text only ``text_body``; markdown may fall
+    back from HTML to text, so it loads both. Without a body, neither.
+    """
+    if not include_body:
+        return _EMAIL_DETAILS_DB_FIELDS
+    if fmt == "html":
+        return _EMAIL_DETAILS_DB_FIELDS + ("body",)
+    if fmt == "text":
+        return _EMAIL_DETAILS_DB_FIELDS + ("text_body",)
+    return _EMAIL_DETAILS_DB_FIELDS + ("body", "text_body")
+
+
 class GetEmailDetailsTool(BaseTool):
     """Tool for getting full email details."""
 
@@ -1970,21 +2398,19 @@ class GetEmailDetailsTool(BaseTool):
             account = self.get_account(target_mailbox)
             mailbox = self.get_mailbox_info(target_mailbox)
 
-            # Find message across all folders (including custom subfolders)
-            item = find_message_for_account(account, message_id)
+            # Find message across all folders (including custom subfolders),
+            # loading only the body representation the response will use.
+            item = find_message_for_account(
+                account, message_id,
+                only_fields=_email_details_fields(fmt, include_body),
+            )
 
             # Get sender email safely
-            sender = safe_get(item, "sender", None)
-            from_email = ""
-            if sender and hasattr(sender, "email_address"):
-                from_email = sender.email_address or ""
+            from_email = email_of(safe_get(item, "sender", None))
 
             # Get recipients safely
-            to_recipients = safe_get(item, "to_recipients", []) or []
-            to_emails = [r.email_address for r in to_recipients if r and hasattr(r, "email_address") and r.email_address]
-
-            cc_recipients = safe_get(item, "cc_recipients", []) or []
-            cc_emails = [r.email_address for r in cc_recipients if r and hasattr(r, "email_address") and r.email_address]
+            to_emails = emails_of(item, "to_recipients")
+            cc_emails = emails_of(item, "cc_recipients")
 
             # Get attachments safely
             attachments = safe_get(item, "attachments", []) or []
@@ -2042,8 +2468,8 @@ class GetEmailDetailsTool(BaseTool):
                 "body": body_value if include_body else "",
                 "body_format": body_format_used if include_body else "omitted",
                 "body_html": html_body_raw if ship_body_html else "",
-                "received_time": safe_get(item, "datetime_received", datetime.now()).isoformat(),
-                "sent_time": safe_get(item, "datetime_sent", datetime.now()).isoformat(),
+                "received_time": _iso_or_epoch(item, "datetime_received"),
+                "sent_time": _iso_or_epoch(item, "datetime_sent"),
                 "is_read": safe_get(item, "is_read", False),
                 "has_attachments": safe_get(item, "has_attachments", False),
                 "importance": safe_get(item, "importance", "Normal") or "Normal",
@@ -2234,19 +2660,10 @@ class GetEmailsBulkTool(BaseTool):
         Shape matches ``GetEmailDetailsTool`` so callers can swap in
         this batch tool without changing their downstream parser.
         """
-        sender = safe_get(message, "sender", None)
-        from_email = getattr(sender, "email_address", "") or ""
+        from_email = email_of(safe_get(message, "sender", None))
 
-        to_recipients = safe_get(message, "to_recipients", []) or []
-        to_emails = [
-            r.email_address for r in to_recipients
-            if hasattr(r, "email_address") and r.email_address
-        ]
-        cc_recipients = safe_get(message, "cc_recipients", []) or []
-        cc_emails = [
-            r.email_address for r in cc_recipients
-            if hasattr(r, "email_address") and r.email_address
-        ]
+        to_emails = emails_of(message, "to_recipients")
+        cc_emails = emails_of(message, "cc_recipients")
         attachments = safe_get(message, "attachments", []) or []
         attachment_names = [
             att.name for att in attachments if hasattr(att, "name") and att.name
@@ -2276,9 +2693,97 @@ class GetEmailsBulkTool(BaseTool):
         return email_details
 
 
+# ---------------------------------------------------------------------------
+# List inputs for the mutation tools
+# ---------------------------------------------------------------------------
+#
+# delete/move/update/copy_email accept ``message_id`` as one ID or a list.
+# A list is applied with one exchangelib bulk_* call instead of one EWS
+# round-trip per message; the single-ID response shape is unchanged.
+
+
+def _message_id_schema(description: str) -> Dict[str, Any]:
+    """``message_id`` schema accepting a single ID or a list of IDs."""
+    return {
+        "oneOf": [
+            {"type": "string"},
+            {"type": "array", "items": {"type": "string"}, "minItems": 1},
+        ],
+        "description": f"{description}. Pass a list to apply to several emails in one EWS call.",
+    }
+
+
+def _normalize_message_ids(message_ids: List[Any]) -> List[str]:
+    """Validate a list of message IDs and drop duplicates, keeping order."""
+    if not message_ids:
+        raise ValidationError("message_id list must not be empty")
+    if any(not isinstance(mid, str) or not mid.strip() for mid in message_ids):
+        raise ValidationError("message_id list entries must be non-empty strings")
+    return list(dict.fromkeys(mid.strip() for mid in message_ids))
+
+
+def _split_bulk_results(message_ids: List[str], results: List[Any]) -> tuple:
+    """Pair a bulk_* result list with its IDs: ``(succeeded, failed)``.
+
+    exchangelib returns one entry per input, with an exception in place
+    of each item it could not process. ``succeeded`` holds
+    ``(message_id, result)`` pairs; ``failed`` holds response dicts.
+    """
+    succeeded: List[tuple] = []
+    failed: List[Dict[str, str]] = []
+    for mid, result in zip(message_ids, results):
+        if isinstance(result, BaseException):
+            failed.append({"message_id": mid, "error": f"{type(result).__name__}: {result}"})
+        else:
+            succeeded.append((mid, result))
+    return succeeded, failed
+
+
+def _bulk_response(
+    verb: str,
+    outcome: str,
+    message_ids: List[str],
+    succeeded: List[tuple],
+    failed: List[Dict[str, str]],
+    **kwargs,
+) -> Dict[str, Any]:
+    """Build the list-input response; raise when every message failed."""
+    if not succeeded:
+        raise ToolExecutionError(f"Failed to {verb} emails: {failed[0]['error']}")
+    response: Dict[str, Any] = {
+        "message_ids": [mid for mid, _ in succeeded],
+        "count": len(succeeded),
+    }
+    if failed:
+        response["failed"] = failed
+    response.update(kwargs)
+    return format_success_response(
+        f"{len(succeeded)} of {len(message_ids)} emails {outcome}",
+        **response,
+    )
+
+
+async def _resolve_destination(account, folder_name: Optional[str], folder_id: Optional[str]) -> tuple:
+    """Resolve a move/copy destination to ``(folder, display_name)``.
+
+    Issue #112: an explicit ``folder_id`` is a single ID lookup and skips
+    the generic name/path resolver, whose heuristics waste round-trips and
+    can mis-route on display names that look like an Exchange ID.
+    """
+    if folder_id:
+        folder = lookup_folder_by_id(account, folder_id)
+        if folder is None:
+            raise ToolExecutionError(f"destination_folder_id not found: {folder_id}")
+        return folder, safe_get(folder, "name", folder_id)
+    folder = await resolve_folder_for_account(account, folder_name)
+    return folder, safe_get(folder, "name", folder_name)
+
+
 class DeleteEmailTool(BaseTool):
     """Tool for deleting emails."""
 
+    mutates_mailbox = True
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "delete_email",
@@ -2290,10 +2795,7 @@ class DeleteEmailTool(BaseTool):
             "inputSchema": {
                 "type": "object",
                 "properties": {
-                    "message_id": {
-                        "type": "string",
-                        "description": "Email message ID to delete"
-                    },
+                    "message_id": _message_id_schema("Email message ID to delete"),
                     "permanent": {
                         "type": "boolean",
                         "description": "Permanently delete (bypasses Trash). Alias: hard_delete.",
@@ -2324,6 +2826,10 @@ class DeleteEmailTool(BaseTool):
         )
         target_mailbox = kwargs.get("target_mailbox")
 
+        if isinstance(message_id, list):
+            return self._delete_many(
+                _normalize_message_ids(message_id), permanent, target_mailbox,
+            )
         if not message_id or not isinstance(message_id, str) or not message_id.strip():
             raise ValidationError("message_id is required")
 
@@ -2350,6 +2856,7 @@ class DeleteEmailTool(BaseTool):
                 # Move to trash (Deleted Items) so the user can recover.
                 item.move(account.trash)
                 action = "moved to trash"
+            clear_search_cache()
 
             self.logger.info(f"Email {message_id} {action} in mailbox: {mailbox}")
 
@@ -2369,10 +2876,45 @@ class DeleteEmailTool(BaseTool):
                 f"Failed to delete email: {type(e).__name__}: {e}"
             )
 
+    def _delete_many(
+        self, message_ids: List[str], permanent: bool, target_mailbox: Optional[str],
+    ) -> Dict[str, Any]:
+        """Delete (or trash) every listed message with one bulk EWS call."""
+        try:
+            account = self.get_account(target_mailbox)
+            mailbox = self.get_mailbox_info(target_mailbox)
+
+            ids = [(mid, None) for mid in message_ids]
+            if permanent:
+                results = account.bulk_delete(ids)
+                action = "permanently deleted"
+            else:
+                results = account.bulk_move(ids, to_folder=account.trash)
+                action = "moved to trash"
+            clear_search_cache()
+        except Exception as e:
+            self.logger.exception(f"Failed to delete emails: {type(e).__name__}: {e}")
+            raise ToolExecutionError(
+                f"Failed to delete emails: {type(e).__name__}: {e}"
+            )
+
+        succeeded, failed = _split_bulk_results(message_ids, results)
+        self.logger.info(
+            f"{len(succeeded)}/{len(message_ids)} emails {action} in mailbox: {mailbox}"
+        )
+        return _bulk_response(
+            "delete", action, message_ids, succeeded, failed,
+            permanent=permanent,
+            hard_delete=permanent,
+            mailbox=mailbox,
+        )
+
 
 class MoveEmailTool(BaseTool):
     """Tool for moving emails between folders."""
 
+    mutates_mailbox = True
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "move_email",
@@ -2380,10 +2922,7 @@ class MoveEmailTool(BaseTool):
             "inputSchema": {
                 "type": "object",
                 "properties": {
-                    "message_id": {
-                        "type": "string",
-                        "description": "Email message ID to move"
-                    },
+                    "message_id": _message_id_schema("Email message ID to move"),
                     "destination_folder": {
                         "type": "string",
                         "description": "Destination folder name or path (e.g. inbox, Inbox/Projects)"
@@ -2412,32 +2951,36 @@ class MoveEmailTool(BaseTool):
             raise ToolExecutionError("message_id is required")
         if not destination_folder and not destination_folder_id:
             raise ToolExecutionError("Either destination_folder or destination_folder_id is required")
+        message_ids = _normalize_message_ids(message_id) if isinstance(message_id, list) else None
 
         try:
             # Get account (primary or impersonated)
             account = self.get_account(target_mailbox)
             mailbox = self.get_mailbox_info(target_mailbox)
 
-            # Issue #112: when ``destination_folder_id`` is supplied, resolve
-            # by ID directly rather than running through the generic resolver.
-            # The generic resolver does path / name / prefix heuristics that
-            # waste round-trips and can mis-route on folders whose display
-            # names happen to look like an Exchange ID. Explicit ID inputs
-            # should be a single ID lookup.
-            if destination_folder_id:
-                dest_folder = find_folder_by_id(account.root, destination_folder_id)
-                if dest_folder is None:
-                    raise ToolExecutionError(
-                        f"destination_folder_id not found: {destination_folder_id}"
-                    )
-                dest_name = safe_get(dest_folder, "name", destination_folder_id)
-            else:
-                dest_folder = await resolve_folder_for_account(account, destination_folder)
-                dest_name = safe_get(dest_folder, "name", destination_folder)
+            dest_folder, dest_name = await _resolve_destination(
+                account, destination_folder, destination_folder_id,
+            )
+
+            if message_ids is not None:
+                results = account.bulk_move(
+                    [(mid, None) for mid in message_ids], to_folder=dest_folder,
+                )
+                clear_search_cache()
+                succeeded, failed = _split_bulk_results(message_ids, results)
+                self.logger.info(
+                    f"{len(succeeded)}/{len(message_ids)} emails moved to {dest_name} in mailbox: {mailbox}"
+                )
+                return _bulk_response(
+                    "move", f"moved to {dest_name}", message_ids, succeeded, failed,
+                    destination_folder=dest_name,
+                    mailbox=mailbox,
+                )
 
             # Find message across all folders (including custom subfolders)
             item = find_message_for_account(account, message_id)
             item.move(dest_folder)
+            clear_search_cache()
 
             self.logger.info(f"Email {message_id} moved to {dest_name} in mailbox: {mailbox}")
 
@@ -2450,6 +2993,11 @@ class MoveEmailTool(BaseTool):
 
         except ToolExecutionError:
             raise
+        except ErrorFolderNotFound as e:
+            # The indexed destination no longer exists; re-walk next time.
+            clear_folder_id_index(account)
+            self.logger.error(f"Failed to move email: {e}")
+            raise ToolExecutionError(f"Failed to move email: {e}")
         except Exception as e:
             self.logger.error(f"Failed to move email: {e}")
             raise ToolExecutionError(f"Failed to move email: {e}")
@@ -2458,6 +3006,8 @@ class MoveEmailTool(BaseTool):
 class UpdateEmailTool(BaseTool):
     """Tool for updating email properties."""
 
+    mutates_mailbox = True
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "update_email",
@@ -2465,10 +3015,7 @@ class UpdateEmailTool(BaseTool):
             "inputSchema": {
                 "type": "object",
                 "properties": {
-                    "message_id": {
-                        "type": "string",
-                        "description": "Email message ID"
-                    },
+                    "message_id": _message_id_schema("Email message ID"),
                     "is_read": {
                         "type": "boolean",
                         "description": "Mark as read (true) or unread (false)"
@@ -2504,46 +3051,56 @@ class UpdateEmailTool(BaseTool):
 
         if not message_id:
             raise ToolExecutionError("message_id is required")
+        message_ids = _normalize_message_ids(message_id) if isinstance(message_id, list) else None
 
         try:
             # Get account (primary or impersonated)
             account = self.get_account(target_mailbox)
             mailbox = self.get_mailbox_info(target_mailbox)
 
-            # Find the message across common folders
-            message = find_message_for_account(account, message_id)
-
-            # Track what was updated
+            # Track what was updated (response keys) and the exchangelib
+            # field each change writes, so a list of messages can share it.
             updates = {}
+            changes = {}
 
             # Update read status
             if "is_read" in kwargs:
-                message.is_read = kwargs["is_read"]
+                changes["is_read"] = kwargs["is_read"]
                 updates["is_read"] = kwargs["is_read"]
 
             # Update categories
             if "categories" in kwargs:
-                message.categories = kwargs["categories"]
+                changes["categories"] = kwargs["categories"]
                 updates["categories"] = kwargs["categories"]
 
             # Update flag status using ExtendedProperty
             if "flag_status" in kwargs:
-                flag_value = FLAG_STATUS_MAP.get(kwargs["flag_status"])
-                if kwargs["flag_status"] not in FLAG_STATUS_MAP:
+                try:
+                    flag_value = FLAG_STATUS_MAP[kwargs["flag_status"]]
+                except KeyError:
                     raise ToolExecutionError(
                         f"Invalid flag_status: {kwargs['flag_status']}. "
-                        f"Valid values: {', '.join(FLAG_STATUS_MAP.keys())}"
+                        f"Valid values: {_FLAG_KEYS_STR}"
                     )
-                message.flag_status_value = flag_value
+                changes["flag_status_value"] = flag_value
                 updates["flag_status"] = kwargs["flag_status"]
 
             # Update importance
             if "importance" in kwargs:
-                message.importance = kwargs["importance"]
+                changes["importance"] = kwargs["importance"]
                 updates["importance"] = kwargs["importance"]
 
+            if message_ids is not None:
+                return self._update_many(account, mailbox, message_ids, changes, updates)
+
+            # Find the message across common folders
+            message = find_message_for_account(account, message_id)
+            for field_name, value in changes.items():
+                setattr(message, field_name, value)
+
             # Save changes
             message.save()
+            clear_search_cache()
 
             self.logger.info(f"Email {message_id} updated in mailbox {mailbox}: {updates}")
 
@@ -2560,10 +3117,51 @@ class UpdateEmailTool(BaseTool):
             self.logger.error(f"Failed to update email: {e}")
             raise ToolExecutionError(f"Failed to update email: {e}")
 
+    def _update_many(
+        self,
+        account: Any,
+        mailbox: str,
+        message_ids: List[str],
+        changes: Dict[str, Any],
+        updates: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Apply ``changes`` to every listed message: one GetItem, one UpdateItem."""
+        if not changes:
+            raise ToolExecutionError("No updates specified")
+
+        # UpdateItem needs each item's current change key, so fetch them in
+        # one batch, loading only the fields being written.
+        fetched = list(account.fetch(
+            ids=[(mid, None) for mid in message_ids],
+            only_fields=list(changes),
+        ))
+        found, failed = _split_bulk_results(message_ids, fetched)
+        for _, message in found:
+            for field_name, value in changes.items():
+                setattr(message, field_name, value)
+
+        results = account.bulk_update(
+            [(message, list(changes)) for _, message in found]
+        ) if found else []
+        clear_search_cache()
+        succeeded, update_failed = _split_bulk_results([mid for mid, _ in found], results)
+        failed.extend(update_failed)
+
+        self.logger.info(
+            f"{len(succeeded)}/{len(message_ids)} emails updated in mailbox {mailbox}: {updates}"
+        )
+        return _bulk_response(
+            "update", "updated", message_ids, succeeded, failed,
+            updates=updates,
+            mailbox=mailbox,
+        )
+
 
 class CopyEmailTool(BaseTool):
     """Tool for copying emails to another folder."""
 
+    mutates_mailbox = True
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "copy_email",
@@ -2571,10 +3169,7 @@ class CopyEmailTool(BaseTool):
             "inputSchema": {
                 "type": "object",
                 "properties": {
-                    "message_id": {
-                        "type": "string",
-                        "description": "Email message ID to copy"
-                    },
+                    "message_id": _message_id_schema("Email message ID to copy"),
                     "destination_folder": {
                         "type": "string",
                         "description": "Destination folder name",
@@ -2605,30 +3200,61 @@ class CopyEmailTool(BaseTool):
 
         if not destination_folder_name and not destination_folder_id:
             raise ToolExecutionError("Either destination_folder or destination_folder_id is required")
+        message_ids = _normalize_message_ids(message_id) if isinstance(message_id, list) else None
 
         try:
             # Get account (primary or impersonated)
             account = self.get_account(target_mailbox)
             mailbox = self.get_mailbox_info(target_mailbox)
 
+            if message_ids is not None:
+                destination_folder, dest_name = await _resolve_destination(
+                    account, destination_folder_name, destination_folder_id,
+                )
+                results = account.bulk_copy(
+                    [(mid, None) for mid in message_ids], to_folder=destination_folder,
+                )
+                clear_search_cache()
+                succeeded, failed = _split_bulk_results(message_ids, results)
+                self.logger.info(
+                    f"{len(succeeded)}/{len(message_ids)} emails copied to {dest_name} in mailbox: {mailbox}"
+                )
+                # bulk_copy yields (id, changekey) tuples for the new items.
+                copies = [
+                    {
+                        "message_id": mid,
+                        "copied_message_id": (
+                            new_id[0] if isinstance(new_id, tuple) else ews_id_to_str(new_id)
+                        ) or "",
+                    }
+                    for mid, new_id in succeeded
+                ]
+                return _bulk_response(
+                    "copy", f"copied to {dest_name}", message_ids, succeeded, failed,
+                    copies=copies,
+                    destination_folder=dest_name,
+                    mailbox=mailbox,
+                )
+
             message = find_message_for_account(account, message_id)
-            source_folder_name = safe_get(safe_get(message, "folder", None), "name", "unknown")
+            source_folder = safe_get(message, "folder", None)
+            if source_folder is None:
+                # Directly fetched items have no folder handle; look the
+                # parent up in the account's already-loaded folder tree.
+                parent_id = safe_get(message, "parent_folder_id", None)
+                try:
+                    source_folder = account.root.get_folder(parent_id) if parent_id else None
+                except Exception:
+                    source_folder = None
+            source_folder_name = safe_get(source_folder, "name", "unknown") or "unknown"
 
-            # Issue #112: explicit destination_folder_id resolves directly,
-            # skipping the generic name/path resolver.
-            if destination_folder_id:
-                destination_folder = find_folder_by_id(account.root, destination_folder_id)
-                if destination_folder is None:
-                    raise ToolExecutionError(
-                        f"destination_folder_id not found: {destination_folder_id}"
-                    )
-                dest_name = safe_get(destination_folder, "name", destination_folder_id)
-            else:
-                destination_folder = await resolve_folder_for_account(account, destination_folder_name)
-                dest_name = safe_get(destination_folder, "name", destination_folder_name)
+            destination_folder, dest_name = await _resolve_destination(
+                account, destination_folder_name, destination_folder_id,
+            )
 
             # Copy the message (exchangelib uses .copy() method)
             copied_message = message.copy(to_folder=destination_folder)
+            clear_search_cache()
 
             subject = safe_get(message, 'subject', 'No Subject')
 
@@ -2655,14 +3281,148 @@ class CopyEmailTool(BaseTool):
 
         except ToolExecutionError:
             raise
+        except ErrorFolderNotFound as e:
+            # The indexed destination no longer exists; re-walk next time.
+            clear_folder_id_index(account)
+            self.logger.error(f"Failed to copy email: {e}")
+            raise ToolExecutionError(f"Failed to copy email: {e}")
         except Exception as e:
             self.logger.error(f"Failed to copy email: {e}")
             raise ToolExecutionError(f"Failed to copy email: {e}")
 
 
+# Original messages quoted by reply/forward, keyed by (mailbox, message_id).
+# Replying and then forwarding (or retrying a failed send) on the same
+# message within a short window skips the cross-folder lookup. Entries live
+# for _ORIGINAL_MESSAGE_TTL seconds (expired ones are pruned on every get
+# and put) and are dropped by clear_search_cache() on any mailbox
+# mutation. Reply/forward also drop their entry once the send finishes
+# either way, because copy_attachments_to_message has by then loaded the
+# attachment bytes into the cached Message.
+_ORIGINAL_MESSAGE_CACHE: Dict[tuple, tuple] = {}
+_ORIGINAL_MESSAGE_CACHE_MAX = 256
+_ORIGINAL_MESSAGE_TTL = 60.0
+
+# Everything reply/forward read off the original: format_forward_header
+# (sender/author/headers/recipients/datetime_sent/subject), extract_body_html
+# (body), copy_attachments_to_message (attachments) and the threading
+# headers. Requesting just these in the GetItem keeps unused properties
+# out of the response.
+_QUOTED_MESSAGE_FIELDS = (
+    "subject", "sender", "author", "to_recipients", "cc_recipients",
+    "datetime_sent", "body", "attachments", "message_id", "references",
+    "headers",
+)
+
+
+def _original_message_key(account, message_id: str) -> tuple:
+    smtp = (getattr(account, "primary_smtp_address", "") or "").lower()
+    return (smtp, message_id)
+
+
+def _prune_original_message_cache(now: float) -> None:
+    """Drop expired entries; clear outright if still at capacity."""
+    for stale_key in [
+        k for k, (stored_at, _) in _ORIGINAL_MESSAGE_CACHE.items()
+        if now - stored_at >= _ORIGINAL_MESSAGE_TTL
+    ]:
+        _ORIGINAL_MESSAGE_CACHE.pop(stale_key, None)
+    if len(_ORIGINAL_MESSAGE_CACHE) >= _ORIGINAL_MESSAGE_CACHE_MAX:
+        _ORIGINAL_MESSAGE_CACHE.clear()
+
+
+def _find_original_message(account, message_id: str):
+    """find_message_for_account with a short-lived per-mailbox memo."""
+    key = _original_message_key(account, message_id)
+    now = time.monotonic()
+    _prune_original_message_cache(now)
+    cached = _ORIGINAL_MESSAGE_CACHE.get(key)
+    if cached is not None:
+        return cached[1]
+
+    message = find_message_for_account(
+        account, message_id, only_fields=_QUOTED_MESSAGE_FIELDS
+    )
+    _prune_original_message_cache(now)
+    _ORIGINAL_MESSAGE_CACHE[key] = (now, message)
+    return message
+
+
+def _forget_original_message(account, message_id: str) -> None:
+    """Evict one quoted original (its attachments may now be loaded)."""
+    _ORIGINAL_MESSAGE_CACHE.pop(_original_message_key(account, message_id), None)
+
+
+def _set_threading_headers(message, original_message, logger) -> None:
+    """Thread ``message`` under ``original_message`` (In-Reply-To/References).
+
+    Shared by reply and forward, which build a fresh Message rather than
+    using create_reply()/create_forward() and so must set these themselves.
+    """
+    original_internet_msg_id = safe_get(original_message, "message_id", None)
+    if not original_internet_msg_id:
+        return
+    original_references = safe_get(original_message, "references", None)
+    message.in_reply_to = original_internet_msg_id
+    if original_references:
+        message.references = f"{original_references} {original_internet_msg_id}"
+    else:
+        message.references = original_internet_msg_id
+    logger.info(f"Set threading headers: in_reply_to={original_internet_msg_id}")
+
+
+def _read_attachment_file(file_path: str, max_bytes: int) -> bytes:
+    """Read one attachment, refusing files over ``max_bytes`` before loading.
+
+    A stat is far cheaper than pulling a runaway multi-GB file into memory
+    only for Exchange to reject the message afterwards.
+    """
+    size = os.path.getsize(file_path)
+    if max_bytes and size > max_bytes:
+        raise ToolExecutionError(
+            f"Attachment too large: {file_path} ({size} bytes, limit {max_bytes})"
+        )
+    return Path(file_path).read_bytes()
+
+
+async def _read_attachment_files(paths: List[str], max_bytes: int = 0) -> List[tuple]:
+    """Read local attachment files concurrently, returning (name, bytes) pairs.
+
+    Reads run on worker threads and overlap; results keep the input order.
+    The first failing path (in input order) is raised as ToolExecutionError
+    with the same messages the sequential loop used. ``max_bytes`` (0 = no
+    limit) is checked per file before it is read.
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_read_attachment_file, p, max_bytes) for p in paths),
+        return_exceptions=True,
+    )
+    files = []
+    for file_path, content in zip(paths, results):
+        if isinstance(content, ToolExecutionError):
+            raise content
+        if isinstance(content, FileNotFoundError):
+            raise ToolExecutionError(f"Attachment file not found: {file_path}")
+        if isinstance(content, PermissionError):
+            raise ToolExecutionError(f"Permission denied reading attachment: {file_path}")
+        if isinstance(content, BaseException):
+            raise ToolExecutionError(f"Failed to attach file {file_path}: {content}")
+        # Use os.path.basename for cross-platform path handling
+        files.append((os.path.basename(file_path), content))
+    return files
+
+
+def _max_attachment_size(ews_client: Any) -> int:
+    """Configured ``MAX_ATTACHMENT_SIZE`` in bytes (0 disables the check)."""
+    config = getattr(ews_client, "config", None)
+    return int(getattr(config, "max_attachment_size", 0) or 0)
+
+
 class ReplyEmailTool(BaseTool):
     """Tool for replying to emails while preserving conversation thread."""
 
+    mutates_mailbox = True
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "reply_email",
@@ -2725,20 +3485,11 @@ class ReplyEmailTool(BaseTool):
             mailbox = self.get_mailbox_info(target_mailbox)
 
             # Find the original message across folders
-            original_message = find_message_for_account(account, message_id)
+            original_message = _find_original_message(account, message_id)
 
             # Get original message details for the response
             original_subject = safe_get(original_message, "subject", "") or ""
-            original_sender = safe_get(original_message, "sender", None)
-            original_from_email = ""
-            if original_sender and hasattr(original_sender, "email_address"):
-                original_from_email = original_sender.email_address or ""
-
-            # Get original recipients for reply-all
-            original_to = [r.email_address for r in (safe_get(original_message, "to_recipients", []) or [])
-                          if r and hasattr(r, "email_address") and r.email_address]
-            original_cc = [r.email_address for r in (safe_get(original_message, "cc_recipients", []) or [])
-                         if r and hasattr(r, "email_address") and r.email_address]
+            original_from_email = email_of(safe_get(original_message, "sender", None))
 
             # IMPORTANT: DO NOT use create_reply()/create_reply_all() - they auto-append content we can't control
             # This causes duplication and wrong order issues with Exclaimer signature placement.
@@ -2750,16 +3501,23 @@ class ReplyEmailTool(BaseTool):
 
             # Determine recipients for the reply
             if reply_all:
-                # Reply all: original sender + all original recipients (except self)
-                reply_to_recipients = [Mailbox(email_address=original_from_email)]
-                for email in original_to + original_cc:
-                    if email != account.primary_smtp_address:
-                        reply_to_recipients.append(Mailbox(email_address=email))
-                self.logger.info(f"Reply-all to {len(reply_to_recipients)} recipient(s)")
+                # Reply all: original sender + all original recipients (except
+                # self), each address once even when it is on both To and Cc.
+                # Addresses compare case-insensitively.
+                reply_to_list = [original_from_email]
+                seen = {original_from_email.lower(), (account.primary_smtp_address or "").lower()}
+                for field_name in ("to_recipients", "cc_recipients"):
+                    for r in safe_get(original_message, field_name, []) or []:
+                        email = getattr(r, "email_address", None) if r else None
+                        if email and email.lower() not in seen:
+                            seen.add(email.lower())
+                            reply_to_list.append(email)
+                self.logger.info(f"Reply-all to {len(reply_to_list)} recipient(s)")
             else:
                 # Reply: just original sender
-                reply_to_recipients = [Mailbox(email_address=original_from_email)]
+                reply_to_list = [original_from_email]
                 self.logger.info(f"Reply to {original_from_email}")
+            reply_to_recipients = [Mailbox(email_address=email) for email in reply_to_list]
 
             # Build the complete reply body manually
             # 1. User's message at top.
@@ -2838,15 +3596,7 @@ class ReplyEmailTool(BaseTool):
             )
 
             # Set threading headers so reply stays in the same conversation
-            original_internet_msg_id = safe_get(original_message, "message_id", None)
-            original_references = safe_get(original_message, "references", None)
-            if original_internet_msg_id:
-                message.in_reply_to = original_internet_msg_id
-                if original_references:
-                    message.references = f"{original_references} {original_internet_msg_id}"
-                else:
-                    message.references = original_internet_msg_id
-                self.logger.info(f"Set threading headers: in_reply_to={original_internet_msg_id}")
+            _set_threading_headers(message, original_message, self.logger)
 
             # Copy original inline attachments (signatures, embedded images)
             inline_count, _ = copy_attachments_to_message(original_message, message)
@@ -2856,25 +3606,18 @@ class ReplyEmailTool(BaseTool):
             # Add new attachments if provided
             new_attachment_count = 0
             if attachments:
-                for file_path in attachments:
-                    try:
-                        # Use os.path.basename for cross-platform path handling
-                        file_name = os.path.basename(file_path)
-                        with open(file_path, 'rb') as f:
-                            content = f.read()
-                            attachment = FileAttachment(
-                                name=file_name,
-                                content=content
-                            )
-                            message.attach(attachment)
-                            new_attachment_count += 1
-                            self.logger.info(f"Attached file: {file_name} ({len(content)} bytes)")
-                    except FileNotFoundError:
-                        raise ToolExecutionError(f"Attachment file not found: {file_path}")
-                    except PermissionError:
-                        raise ToolExecutionError(f"Permission denied reading attachment: {file_path}")
-                    except Exception as e:
-                        raise ToolExecutionError(f"Failed to attach file {file_path}: {e}")
+                # Read every file off the event loop in parallel, then hand
+                # them to the message in one attach() call, in the caller's
+                # order. They go out with the single CreateItem on send().
+                log_info = self.logger.info
+                file_attachments = []
+                for file_name, content in await _read_attachment_files(
+                    attachments, _max_attachment_size(self.ews_client)
+                ):
+                    file_attachments.append(FileAttachment(name=file_name, content=content))
+                    log_info(f"Attached file: {file_name} ({len(content)} bytes)")
+                message.attach(file_attachments)
+                new_attachment_count += len(file_attachments)
 
             # Add inline (base64) attachments if provided
             inline_b64_count = attach_inline_files(message, kwargs.get("inline_attachments", []))
@@ -2884,16 +3627,9 @@ class ReplyEmailTool(BaseTool):
 
             # Send the message
             message.send()
+            _forget_original_message(account, message_id)
             self.logger.info(f"Reply sent to {original_from_email} from mailbox: {mailbox}")
 
-            # Determine who the reply was sent to
-            reply_to_list = []
-            if reply_all:
-                reply_to_list = [original_from_email] + [e for e in original_to + original_cc
-                                                        if e != account.primary_smtp_address]
-            else:
-                reply_to_list = [original_from_email]
-
             return format_success_response(
                 "Reply sent successfully",
                 original_subject=original_subject,
@@ -2907,6 +3643,8 @@ class ReplyEmailTool(BaseTool):
         except ToolExecutionError:
             raise
         except Exception as e:
+            # The quoted original may be what broke the send; refetch next time.
+            _ORIGINAL_MESSAGE_CACHE.clear()
             self.logger.error(f"Failed to send reply: {e}")
             raise ToolExecutionError(f"Failed to send reply: {e}")
 
@@ -2914,6 +3652,8 @@ class ReplyEmailTool(BaseTool):
 class ForwardEmailTool(BaseTool):
     """Tool for forwarding emails to new recipients while preserving original content."""
 
+    mutates_mailbox = True
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "forward_email",
@@ -2988,7 +3728,7 @@ class ForwardEmailTool(BaseTool):
             mailbox = self.get_mailbox_info(target_mailbox)
 
             # Find the original message across folders
-            original_message = find_message_for_account(account, message_id)
+            original_message = _find_original_message(account, message_id)
 
             # Get original message details
             original_subject = safe_get(original_message, "subject", "") or ""
@@ -3054,29 +3794,25 @@ class ForwardEmailTool(BaseTool):
 
             self.logger.info(f"Constructed complete forward body: {len(complete_body)} characters")
 
+            # Bound once for the recipient comprehensions below; forwards to
+            # large distribution lists build one Mailbox per address.
+            mailbox_cls = Mailbox
+
             # Create a new Message with the complete body
             message = Message(
                 account=account,
                 subject=forward_subject,
                 body=HTMLBody(complete_body),
-                to_recipients=[Mailbox(email_address=email) for email in to_recipients]
+                to_recipients=[mailbox_cls(email_address=email) for email in to_recipients]
             )
 
             # Set threading headers so forward stays in the same conversation
-            original_internet_msg_id = safe_get(original_message, "message_id", None)
-            original_references = safe_get(original_message, "references", None)
-            if original_internet_msg_id:
-                message.in_reply_to = original_internet_msg_id
-                if original_references:
-                    message.references = f"{original_references} {original_internet_msg_id}"
-                else:
-                    message.references = original_internet_msg_id
-                self.logger.info(f"Set threading headers: in_reply_to={original_internet_msg_id}")
+            _set_threading_headers(message, original_message, self.logger)
 
             if cc_recipients:
-                message.cc_recipients = [Mailbox(email_address=email) for email in cc_recipients]
+                message.cc_recipients = [mailbox_cls(email_address=email) for email in cc_recipients]
             if bcc_recipients:
-                message.bcc_recipients = [Mailbox(email_address=email) for email in bcc_recipients]
+                message.bcc_recipients = [mailbox_cls(email_address=email) for email in bcc_recipients]
 
             # Copy original attachments
             inline_count, regular_count = copy_attachments_to_message(original_message, message)
@@ -3087,25 +3823,18 @@ class ForwardEmailTool(BaseTool):
             # Add additional attachments if provided
             additional_attachment_count = 0
             if additional_attachments:
-                for file_path in additional_attachments:
-                    try:
-                        # Use os.path.basename for cross-platform path handling
-                        file_name = os.path.basename(file_path)
-                        with open(file_path, 'rb') as f:
-                            content = f.read()
-                            attachment = FileAttachment(
-                                name=file_name,
-                                content=content
-                            )
-                            message.attach(attachment)
-                            additional_attachment_count += 1
-                            self.logger.info(f"Attached additional file: {file_name} ({len(content)} bytes)")
-                    except FileNotFoundError:
-                        raise ToolExecutionError(f"Attachment file not found: {file_path}")
-                    except PermissionError:
-                        raise ToolExecutionError(f"Permission denied reading attachment: {file_path}")
-                    except Exception as e:
-                        raise ToolExecutionError(f"Failed to attach file {file_path}: {e}")
+                # Read every file off the event loop in parallel, then hand
+                # them to the message in one attach() call, in the caller's
+                # order. They go out with the single CreateItem on send().
+                log_info = self.logger.info
+                file_attachments = []
+                for file_name, content in await _read_attachment_files(
+                    additional_attachments, _max_attachment_size(self.ews_client)
+                ):
+                    file_attachments.append(FileAttachment(name=file_name, content=content))
+                    log_info(f"Attached additional file: {file_name} ({len(content)} bytes)")
+                message.attach(file_attachments)
+                additional_attachment_count += len(file_attachments)
 
             # Add inline (base64) attachments if provided
             inline_b64_count = attach_inline_files(message, kwargs.get("inline_attachments", []))
@@ -3115,6 +3844,7 @@ class ForwardEmailTool(BaseTool):
 
             # Send the message
             message.send()
+            _forget_original_message(account, message_id)
             self.logger.info(f"Email forwarded to {', '.join(to_recipients)} from mailbox: {mailbox}")
 
             return format_success_response(
@@ -3132,5 +3862,7 @@ class ForwardEmailTool(BaseTool):
         except ToolExecutionError:
             raise
         except Exception as e:
+            # The quoted original may be what broke the send; refetch next time.
+            _ORIGINAL_MESSAGE_CACHE.clear()
             self.logger.error(f"Failed to forward email: {e}")
             raise ToolExecutionError(f"Failed to forward email: {e}")
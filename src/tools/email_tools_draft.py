@@ -24,6 +24,8 @@ from ..utils import (
     escape_html,
     format_body_for_html,
     sanitize_html,
+    email_of,
+    emails_of,
 )
 from ..body_format import compose_body, WRITE_FORMAT_SCHEMA as BODY_FORMAT_SCHEMA
 from .email_tools import add_reply_prefix, add_forward_prefix
@@ -32,6 +34,8 @@ from .email_tools import add_reply_prefix, add_forward_prefix
 class CreateDraftTool(BaseTool):
     """Tool for creating draft emails in the Drafts folder."""
 
+    mutates_mailbox = True
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "create_draft",
@@ -181,6 +185,8 @@ class CreateDraftTool(BaseTool):
 class CreateReplyDraftTool(BaseTool):
     """Tool for creating reply drafts in the Drafts folder."""
 
+    mutates_mailbox = True
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "create_reply_draft",
@@ -270,23 +276,13 @@ class CreateReplyDraftTool(BaseTool):
             original_subject = safe_get(original_message, "subject", "") or ""
             # Use shared prefix helpers so we don't produce "RE: RE: ..." stacks.
             reply_subject = add_reply_prefix(original_subject) if original_subject else "RE:"
-            original_sender = safe_get(original_message, "sender", None)
-            original_from_email = ""
-            if original_sender and hasattr(original_sender, "email_address"):
-                original_from_email = original_sender.email_address or ""
-
-            original_to = [
-                r.email_address
-                for r in (safe_get(original_message, "to_recipients", []) or [])
-                if r and hasattr(r, "email_address") and r.email_address
-            ]
-            original_cc = [
-                r.email_address
-                for r in (safe_get(original_message, "cc_recipients", []) or [])
-                if r and hasattr(r, "email_address") and r.email_address
-            ]
+            original_from_email = email_of(safe_get(original_message, "sender", None))
 
             if reply_all:
+                # Only reply-all needs the original To/Cc; a plain reply
+                # never scans them.
+                original_to = emails_of(original_message, "to_recipients")
+                original_cc = emails_of(original_message, "cc_recipients")
                 seen = set()
                 reply_to_recipients = []
                 for email in [original_from_email] + original_to + original_cc:
@@ -407,6 +403,8 @@ class CreateReplyDraftTool(BaseTool):
 class CreateForwardDraftTool(BaseTool):
     """Tool for creating forward drafts in the Drafts folder."""
 
+    mutates_mailbox = True
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "create_forward_draft",
@@ -1,17 +1,35 @@
 """Folder management tools for EWS MCP Server."""
 
+import logging
 from difflib import SequenceMatcher
-from typing import Any, Dict
+from typing import Any, Dict, Set, Tuple
 from exchangelib import Folder
 
 from .base import BaseTool
 from ..exceptions import ToolExecutionError, ValidationError
 from ..utils import format_success_response, safe_get, ews_id_to_str
 
+_log = logging.getLogger(__name__)
+
+
+# Per-mailbox memo of the distinguished folders. Keyed by the lowercased
+# primary SMTP address; the Account the map was built from is stored
+# alongside so a re-created Account (e.g. after re-auth) rebuilds it.
+_STANDARD_FOLDER_MAP_CACHE: Dict[str, tuple] = {}
+
 
 def get_standard_folder_map(account):
-    """Get standard folder name to object mapping."""
-    return {
+    """Get standard folder name to object mapping.
+
+    The mapping is built once per account and a shallow copy is
+    returned, so callers may add entries without touching the cache.
+    """
+    key = (safe_get(account, "primary_smtp_address", "") or "").lower()
+    cached = _STANDARD_FOLDER_MAP_CACHE.get(key) if key else None
+    if cached is not None and cached[0] is account:
+        return dict(cached[1])
+
+    folder_map = {
         "root": account.root,
         "inbox": account.inbox,
         "sent": account.sent,
@@ -22,6 +40,9 @@ def get_standard_folder_map(account):
         "contacts": account.contacts,
         "tasks": account.tasks
     }
+    if key:
+        _STANDARD_FOLDER_MAP_CACHE[key] = (account, folder_map)
+    return dict(folder_map)
 
 
 def find_folder_by_id(parent, target_id):
@@ -37,10 +58,165 @@ def find_folder_by_id(parent, target_id):
     return None
 
 
+# Per-mailbox folder-ID -> Folder index, built from one walk of the
+# folder tree. Stored as (account, index, bare_ids): like the
+# standard-folder map, plus the IDs whose entry is still an ID + name
+# handle loaded from the persistent store (see _sync_folder_id_index).
+_FOLDER_ID_INDEX: Dict[str, tuple] = {}
+
+# Optional persistent backing for the index: a zero-arg callable returning
+# a SQLiteCache (see EWSClient.sqlite_cache), registered at server start.
+# With it, a restarted process loads the stored index and asks EWS only
+# for the hierarchy changes since the saved sync state.
+_FOLDER_INDEX_STORE = None
+
+
+def set_folder_index_store(provider) -> None:
+    """Register (or, with None, remove) the persistent index provider."""
+    global _FOLDER_INDEX_STORE
+    _FOLDER_INDEX_STORE = provider
+
+
+def _sync_folder_id_index(account, mailbox: str, store) -> Tuple[Dict[str, Any], Set[str]]:
+    """Load the stored index and apply one SyncFolderHierarchy delta.
+
+    Without a stored sync state the sync returns every folder, which
+    seeds the store (``replace``); otherwise only the changes since the
+    saved state are applied. SyncFolderHierarchy on the root covers the
+    same folders as ``root.walk()``, every folder class included.
+
+    Stored rows become bare ``Folder`` handles carrying only ID and name;
+    their IDs are returned as the second element so
+    :func:`lookup_folder_by_id` can load the full folder before handing
+    one out. Folders reported by the sync itself are fully loaded.
+    """
+    root = account.root
+    sync_state, rows = store.get_folder_index(mailbox)
+    index: Dict[str, Any] = {
+        folder_id: Folder(root=root, id=folder_id, name=name)
+        for folder_id, name, _ in rows
+    }
+    bare_ids = set(index)
+
+    upserts, deletes = [], []
+    for change_type, folder in root.sync_hierarchy(sync_state=sync_state):
+        if change_type == "delete":
+            folder_id = ews_id_to_str(folder)
+            if folder_id:
+                index.pop(folder_id, None)
+                bare_ids.discard(folder_id)
+                deletes.append(folder_id)
+            continue
+        folder_id = ews_id_to_str(safe_get(folder, "id", None))
+        if folder_id:
+            index[folder_id] = folder
+            bare_ids.discard(folder_id)
+            upserts.append((
+                folder_id,
+                safe_get(folder, "name", None),
+                ews_id_to_str(safe_get(folder, "parent_folder_id", None)),
+            ))
+
+    new_state = safe_get(root, "folder_sync_state", None)
+    if new_state:
+        store.apply_folder_index(
+            mailbox, new_state, upserts, deletes, replace=sync_state is None,
+        )
+    root_id = ews_id_to_str(safe_get(root, "id", None))
+    if root_id:
+        index[root_id] = root
+        bare_ids.discard(root_id)
+    return index, bare_ids
+
+
+def _build_folder_id_index(account, mailbox: str = "") -> Tuple[Dict[str, Any], Set[str]]:
+    """Map every folder ID under ``account.root`` to its Folder object.
+
+    Returns ``(index, bare_ids)``; ``bare_ids`` is empty unless the index
+    came from the persistent store.
+    """
+    provider = _FOLDER_INDEX_STORE
+    if provider is not None and mailbox:
+        try:
+            return _sync_folder_id_index(account, mailbox, provider())
+        except Exception as exc:
+            _log.debug("folder index sync failed for %s, walking tree: %s", mailbox, exc)
+    return _walk_folder_id_index(account), set()
+
+
+def _walk_folder_id_index(account) -> Dict[str, Any]:
+    """Folder-ID index from a full walk of ``account.root``."""
+    root = account.root
+    index: Dict[str, Any] = {}
+    root_id = ews_id_to_str(safe_get(root, "id", None))
+    if root_id:
+        index[root_id] = root
+    for folder in root.walk():
+        folder_id = ews_id_to_str(safe_get(folder, "id", None))
+        if folder_id:
+            index[folder_id] = folder
+    return index
+
+
+def lookup_folder_by_id(account, folder_id: str):
+    """Return the folder with ``folder_id`` in ``account``, or None.
+
+    Uses the cached ID index; on a miss the index is rebuilt once so
+    folders created since the last walk are still found. Callers always
+    get a fully loaded folder: an ID + name handle from the persistent
+    store is loaded with one GetFolder first, falling back to a full
+    tree walk if that fails.
+    """
+    key = (safe_get(account, "primary_smtp_address", "") or "").lower()
+    cached = _FOLDER_ID_INDEX.get(key) if key else None
+    if cached is not None and cached[0] is account:
+        folder = cached[1].get(folder_id)
+        if folder is not None:
+            return _load_bare_folder(account, cached[1], cached[2], folder_id)
+
+    try:
+        index, bare_ids = _build_folder_id_index(account, key)
+    except Exception:
+        # Tree walk unavailable; fall back to the recursive search.
+        return find_folder_by_id(account.root, folder_id)
+    if key:
+        _FOLDER_ID_INDEX[key] = (account, index, bare_ids)
+    if folder_id not in index:
+        return None
+    return _load_bare_folder(account, index, bare_ids, folder_id)
+
+
+def _load_bare_folder(account, index: Dict[str, Any], bare_ids: Set[str], folder_id: str):
+    """Return ``index[folder_id]``, replacing a stored handle with the full folder."""
+    if folder_id not in bare_ids:
+        return index[folder_id]
+    try:
+        folder = Folder.resolve(account=account, folder=index[folder_id])
+    except Exception as exc:
+        _log.debug("loading stored folder %s failed, walking tree: %s", folder_id, exc)
+        walked = _walk_folder_id_index(account)
+        index.clear()
+        index.update(walked)
+        bare_ids.clear()
+        return index.get(folder_id)
+    index[folder_id] = folder
+    bare_ids.discard(folder_id)
+    return folder
+
+
+def clear_folder_id_index(account=None) -> None:
+    """Drop the folder-ID index for ``account``, or for every mailbox."""
+    if account is None:
+        _FOLDER_ID_INDEX.clear()
+        return
+    key = (safe_get(account, "primary_smtp_address", "") or "").lower()
+    _FOLDER_ID_INDEX.pop(key, None)
+
+
 def resolve_parent_folder(account, parent_folder=None, parent_folder_id=None, default_name="root"):
     """Resolve parent folder from ID or standard folder name."""
     if parent_folder_id:
-        folder = find_folder_by_id(account.root, parent_folder_id)
+        folder = lookup_folder_by_id(account, parent_folder_id)
         if not folder:
             raise ToolExecutionError(f"Parent folder not found: {parent_folder_id}")
         return folder, safe_get(folder, "name", parent_folder_id)
@@ -403,6 +579,8 @@ class ManageFolderTool(BaseTool):
     Replaces: create_folder, delete_folder, rename_folder, move_folder.
     """
 
+    mutates_mailbox = True
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "manage_folder",
@@ -485,6 +663,12 @@ class ManageFolderTool(BaseTool):
         if not action:
             raise ToolExecutionError("action is required")
 
+        if action in ("delete", "rename", "move"):
+            # Cached name/path resolutions may point at the folder being
+            # changed. Imported lazily: email_tools imports this module.
+            from .email_tools import clear_folder_cache
+            clear_folder_cache()
+
         if action == "create":
             return await self._create(**kwargs)
         elif action == "delete":
@@ -151,6 +151,8 @@ class GetOOFPolicyTool(BaseTool):
 class ApplyOOFPolicyTool(BaseTool):
     """Evaluate forward rules against one message and optionally create forwards as drafts."""
 
+    mutates_mailbox = True
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "apply_oof_policy",
@@ -349,6 +349,8 @@ class RuleSimulateTool(BaseTool):
 
 
 class EvaluateRulesOnMessageTool(BaseTool):
+    mutates_mailbox = True
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "evaluate_rules_on_message",
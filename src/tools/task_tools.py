@@ -1,19 +1,201 @@
 """Task operation tools for EWS MCP Server."""
 
-from typing import Any, Dict
+import asyncio
+from itertools import islice
+from typing import Any, Dict, List
 from datetime import datetime
 from decimal import Decimal
 from exchangelib import Task
 
 from .base import BaseTool
-from ..models import CreateTaskRequest
-from ..exceptions import ToolExecutionError
-from ..utils import format_success_response, safe_get, parse_datetime_tz_aware, parse_date_tz_aware, ews_id_to_str
+from ..models import CreateTaskRequest, UpdateTaskRequest
+from ..exceptions import ToolExecutionError, ValidationError
+from ..utils import (
+    format_success_response, safe_get, parse_datetime_tz_aware, parse_date_tz_aware,
+    ews_id_to_str, ews_page_size,
+)
+
+
+# Task properties get_tasks reads per item. Passed to ``.only()`` so
+# FindItem returns just these instead of every task property (body included).
+_GET_TASKS_DB_FIELDS: tuple = (
+    "id", "subject", "status", "percent_complete", "is_complete",
+    "due_date", "importance", "datetime_created",
+)
+
+
+def _format_task(item: Any) -> Dict[str, Any]:
+    """Build one ``get_tasks`` result dict from a projected Task.
+
+    Plain ``getattr`` rather than ``safe_get``: Task fields are stored
+    values, not properties that can raise, and an unexpected failure is
+    still caught per item by the caller and counted as skipped.
+    """
+    due_date = getattr(item, "due_date", None)
+    # due_date may be an EWSDate/EWSDateTime, a plain date, or a string —
+    # coerce defensively.
+    if due_date is not None and hasattr(due_date, "isoformat"):
+        due_iso = due_date.isoformat()
+    elif due_date is not None:
+        due_iso = str(due_date)
+    else:
+        due_iso = None
+
+    return {
+        "item_id": ews_id_to_str(getattr(item, "id", None)) or "unknown",
+        "subject": getattr(item, "subject", None) or "",
+        "status": getattr(item, "status", None) or "NotStarted",
+        "percent_complete": getattr(item, "percent_complete", 0),
+        "is_complete": getattr(item, "is_complete", False),
+        "due_date": due_iso,
+        "importance": getattr(item, "importance", None) or "Normal",
+    }
+
+
+# update_task/complete_task/delete_task accept ``item_id`` as one ID or a
+# list. A list is applied with one exchangelib bulk_* call instead of one
+# EWS round-trip per task; the single-ID response shape is unchanged.
+
+
+def _item_id_schema(description: str) -> Dict[str, Any]:
+    """``item_id`` schema accepting a single ID or a list of IDs."""
+    return {
+        "oneOf": [
+            {"type": "string"},
+            {"type": "array", "items": {"type": "string"}, "minItems": 1},
+        ],
+        "description": f"{description}. Pass a list to apply to several tasks in one EWS call.",
+    }
+
+
+def _normalize_item_ids(item_ids: List[Any]) -> List[str]:
+    """Validate a list of task IDs and drop duplicates, keeping order."""
+    if not item_ids:
+        raise ValidationError("item_id list must not be empty")
+    if any(not isinstance(item_id, str) or not item_id.strip() for item_id in item_ids):
+        raise ValidationError("item_id list entries must be non-empty strings")
+    return list(dict.fromkeys(item_id.strip() for item_id in item_ids))
+
+
+def _bulk_task_response(
+    verb: str,
+    outcome: str,
+    item_ids: List[str],
+    succeeded: List[tuple],
+    failed: List[Dict[str, str]],
+    **kwargs,
+) -> Dict[str, Any]:
+    """Build the list-input response; raise when every task failed."""
+    if not succeeded:
+        raise ToolExecutionError(f"Failed to {verb} tasks: {failed[0]['error']}")
+    response: Dict[str, Any] = {
+        "item_ids": [item_id for item_id, _ in succeeded],
+        "count": len(succeeded),
+    }
+    if failed:
+        response["failed"] = failed
+    response.update(kwargs)
+    return format_success_response(
+        f"{len(succeeded)} of {len(item_ids)} tasks {outcome}",
+        **response,
+    )
+
+
+# Upper bound on IDs per GetItem/UpdateItem/DeleteItem request: exchangelib's
+# own default. Writes stay in modest batches to avoid EWS throttling, and
+# are independent of the EWS_PAGE_SIZE read-paging setting.
+_BULK_CHUNK_MAX = 100
+
+
+def _bulk_chunk_size(item_ids: List[str]) -> int:
+    """IDs per bulk EWS request: the whole list, up to ``_BULK_CHUNK_MAX``."""
+    return max(1, min(len(item_ids), _BULK_CHUNK_MAX))
+
+
+def _split_task_results(item_ids: List[str], results: List[Any]) -> tuple:
+    """Pair a bulk_*/fetch result list with its IDs: ``(succeeded, failed)``.
+
+    exchangelib returns one entry per input, with an exception in place of
+    each task it could not process.
+    """
+    succeeded: List[tuple] = []
+    failed: List[Dict[str, str]] = []
+    for item_id, result in zip(item_ids, results):
+        if isinstance(result, BaseException):
+            failed.append({"item_id": item_id, "error": f"{type(result).__name__}: {result}"})
+        else:
+            succeeded.append((item_id, result))
+    return succeeded, failed
+
+
+def _update_tasks(
+    account: Any, item_ids: List[str], changes: Dict[str, Any], chunk_size: int,
+) -> tuple:
+    """Write ``changes`` to every listed task: one GetItem, one UpdateItem.
+
+    UpdateItem needs each task's current change key, so the tasks are
+    fetched in one batch loading only the fields being written (plus
+    ``status`` when ``percent_complete`` changes, since exchangelib keeps
+    the two consistent). Only the changed fields are sent back.
+    ``chunk_size`` caps the IDs per EWS request.
+    Returns ``(succeeded, failed)`` as :func:`_split_task_results`.
+    """
+    fieldnames = list(changes)
+    only_fields = list(fieldnames)
+    if "percent_complete" in changes and "status" not in changes:
+        only_fields.append("status")
+
+    fetched = list(account.fetch(
+        ids=[(item_id, None) for item_id in item_ids],
+        only_fields=only_fields,
+        chunk_size=chunk_size,
+    ))
+    found, failed = _split_task_results(item_ids, fetched)
+    for _, task in found:
+        for field_name, value in changes.items():
+            setattr(task, field_name, value)
+
+    results = account.bulk_update(
+        [(task, fieldnames) for _, task in found],
+        chunk_size=chunk_size,
+    ) if found else []
+    succeeded, update_failed = _split_task_results([item_id for item_id, _ in found], results)
+    failed.extend(update_failed)
+    return succeeded, failed
+
+
+# Task fields update_task may write, as named on UpdateTaskRequest.
+_UPDATE_TASK_FIELDS: tuple = (
+    "subject", "body", "categories", "due_date", "percent_complete", "importance",
+)
+
+
+_COMPLETE_TASK_CHANGES: Dict[str, Any] = {
+    "status": "Completed",
+    "percent_complete": Decimal("100"),
+}
+
+
+def _delete_tasks(account: Any, item_ids: List[str], chunk_size: int) -> tuple:
+    """Hard-delete every listed task with one DeleteItem and no prior GetItem.
+
+    Task deletes must say which occurrences of a recurring task go; spell
+    out exchangelib's defaults so the request never depends on them.
+    """
+    results = account.bulk_delete(
+        [(item_id, None) for item_id in item_ids],
+        send_meeting_cancellations="SendToNone",
+        affected_task_occurrences="AllOccurrences",
+        chunk_size=chunk_size,
+    )
+    return _split_task_results(item_ids, results)
 
 
 class CreateTaskTool(BaseTool):
     """Tool for creating tasks."""
 
+    __slots__ = ()
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "create_task",
@@ -69,8 +251,7 @@ class CreateTaskTool(BaseTool):
         categories = kwargs.get("categories")
 
         try:
-            account = self.get_account(target_mailbox)
-            mailbox = self.get_mailbox_info(target_mailbox)
+            account, mailbox = self.get_account_and_mailbox(target_mailbox)
 
             # Create task
             task = Task(
@@ -85,17 +266,17 @@ class CreateTaskTool(BaseTool):
 
             # Convert datetime to EWSDate for date-only fields
             if request.due_date:
-                task.due_date = parse_date_tz_aware(request.due_date.isoformat())
+                task.due_date = parse_date_tz_aware(request.due_date)
 
             if request.start_date:
-                task.start_date = parse_date_tz_aware(request.start_date.isoformat())
+                task.start_date = parse_date_tz_aware(request.start_date)
 
             task.importance = request.importance.value
 
             # Convert datetime to EWSDateTime for datetime fields
             if request.reminder_time:
                 task.reminder_is_set = True
-                task.reminder_due_by = parse_datetime_tz_aware(request.reminder_time.isoformat())
+                task.reminder_due_by = parse_datetime_tz_aware(request.reminder_time)
 
             # Issue #114 — Outlook categories on the task.
             if categories:
@@ -104,23 +285,25 @@ class CreateTaskTool(BaseTool):
             # Save task
             task.save()
 
-            self.logger.info(f"Created task: {request.subject}")
+            self.logger.info("Created task: %s", request.subject)
 
             return format_success_response(
                 "Task created successfully",
-                item_id=ews_id_to_str(task.id) if hasattr(task, "id") else None,
+                item_id=ews_id_to_str(task.id),
                 subject=request.subject,
                 mailbox=mailbox
             )
 
         except Exception as e:
-            self.logger.error(f"Failed to create task: {e}")
+            self.logger.error("Failed to create task: %s", e)
             raise ToolExecutionError(f"Failed to create task: {e}")
 
 
 class GetTasksTool(BaseTool):
     """Tool for retrieving tasks."""
 
+    __slots__ = ()
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "get_tasks",
@@ -139,6 +322,11 @@ class GetTasksTool(BaseTool):
                         "default": 50,
                         "maximum": 1000
                     },
+                    "newest_first": {
+                        "type": "boolean",
+                        "description": "Sort by creation time, newest first. Set false to skip the server-side sort and take Exchange's default order",
+                        "default": True
+                    },
                     "target_mailbox": {
                         "type": "string",
                         "description": "Email address to operate on (requires impersonation/delegate access)"
@@ -150,12 +338,27 @@ class GetTasksTool(BaseTool):
     async def execute(self, **kwargs) -> Dict[str, Any]:
         """Get tasks."""
         include_completed = kwargs.get("include_completed", False)
-        max_results = kwargs.get("max_results", 50)
+        # An explicit null means "use the default", not "no value".
+        max_results = kwargs.get("max_results")
+        if max_results is None:
+            max_results = 50
+        newest_first = kwargs.get("newest_first")
+        if newest_first is None:
+            newest_first = True
         target_mailbox = kwargs.get("target_mailbox")
 
+        # Nothing requested: answer without an EWS round trip.
+        if max_results <= 0:
+            return format_success_response(
+                "Retrieved 0 tasks",
+                tasks=[],
+                count=0,
+                skipped=0,
+                mailbox=self.get_mailbox_info(target_mailbox),
+            )
+
         try:
-            account = self.get_account(target_mailbox)
-            mailbox = self.get_mailbox_info(target_mailbox)
+            account, mailbox = self.get_account_and_mailbox(target_mailbox)
 
             # Query tasks. ``account.tasks`` can raise if the folder is
             # unavailable on this mailbox, so guard narrowly.
@@ -169,48 +372,47 @@ class GetTasksTool(BaseTool):
             if not include_completed:
                 items = items.filter(is_complete=False)
 
-            items = items.order_by('-datetime_created')
-
-            # Format tasks. Wrap each item so one malformed task cannot
-            # sink the entire response — previously a single bad
-            # ``due_date`` or missing attribute produced an opaque HTTP
-            # 500 for the whole call.
-            tasks = []
-            skipped = 0
-            for item in items[:max_results]:
-                try:
-                    due_date = safe_get(item, "due_date", None)
-                    # due_date may be an EWSDate/EWSDateTime, a plain
-                    # date, or a string — coerce defensively.
-                    if due_date is not None and hasattr(due_date, "isoformat"):
-                        due_iso = due_date.isoformat()
-                    elif due_date is not None:
-                        due_iso = str(due_date)
-                    else:
-                        due_iso = None
-
-                    task_data = {
-                        "item_id": ews_id_to_str(safe_get(item, "id", None)) or "unknown",
-                        "subject": safe_get(item, "subject", "") or "",
-                        "status": safe_get(item, "status", "NotStarted") or "NotStarted",
-                        "percent_complete": safe_get(item, "percent_complete", 0),
-                        "is_complete": safe_get(item, "is_complete", False),
-                        "due_date": due_iso,
-                        "importance": safe_get(item, "importance", "Normal") or "Normal",
-                    }
-                    tasks.append(task_data)
-                except Exception as item_exc:
-                    skipped += 1
-                    self.logger.warning(
-                        "Skipped malformed task id=%r: %s: %s",
-                        safe_get(item, "id", None),
-                        type(item_exc).__name__,
-                        item_exc,
-                    )
-                    continue
+            if newest_first:
+                items = items.order_by('-datetime_created')
+
+            try:
+                items = items.only(*_GET_TASKS_DB_FIELDS)
+            except Exception as only_exc:
+                self.logger.debug(
+                    "query.only(%s) rejected: %s", _GET_TASKS_DB_FIELDS, only_exc,
+                )
+
+            # One FindItem page for the whole request where possible.
+            try:
+                items.page_size = max(1, min(max_results, ews_page_size(self.ews_client)))
+            except Exception:
+                pass
+
+            # Fetch and format in one worker-thread pass; islice stops
+            # pulling pages once max_results tasks have been seen. Each
+            # item is wrapped so one malformed task cannot sink the entire
+            # response — previously a single bad ``due_date`` or missing
+            # attribute produced an opaque HTTP 500 for the whole call.
+            def _collect() -> tuple:
+                formatted: List[Dict[str, Any]] = []
+                bad = 0
+                for item in islice(items, max_results):
+                    try:
+                        formatted.append(_format_task(item))
+                    except Exception as item_exc:
+                        bad += 1
+                        self.logger.warning(
+                            "Skipped malformed task id=%r: %s: %s",
+                            safe_get(item, "id", None),
+                            type(item_exc).__name__,
+                            item_exc,
+                        )
+                return formatted, bad
+
+            tasks, skipped = await asyncio.to_thread(_collect)
 
             self.logger.info(
-                f"Retrieved {len(tasks)} tasks (skipped {skipped} malformed)"
+                "Retrieved %d tasks (skipped %d malformed)", len(tasks), skipped
             )
 
             return format_success_response(
@@ -227,7 +429,7 @@ class GetTasksTool(BaseTool):
             # logger.exception emits the traceback so the operator can see
             # the real upstream cause instead of "Internal Server Error".
             self.logger.exception(
-                f"get_tasks failed: {type(e).__name__}: {e}"
+                "get_tasks failed: %s: %s", type(e).__name__, e
             )
             raise ToolExecutionError(f"Failed to get tasks: {type(e).__name__}: {e}")
 
@@ -235,6 +437,8 @@ class GetTasksTool(BaseTool):
 class UpdateTaskTool(BaseTool):
     """Tool for updating tasks."""
 
+    __slots__ = ()
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "update_task",
@@ -242,10 +446,7 @@ class UpdateTaskTool(BaseTool):
             "inputSchema": {
                 "type": "object",
                 "properties": {
-                    "item_id": {
-                        "type": "string",
-                        "description": "Task item ID"
-                    },
+                    "item_id": _item_id_schema("Task item ID"),
                     "subject": {
                         "type": "string",
                         "description": "New subject (optional)"
@@ -285,46 +486,54 @@ class UpdateTaskTool(BaseTool):
 
     async def execute(self, **kwargs) -> Dict[str, Any]:
         """Update task."""
-        item_id = kwargs.get("item_id")
-        target_mailbox = kwargs.get("target_mailbox")
+        request = self.validate_input(UpdateTaskRequest, **kwargs)
+        item_id = request.item_id
+        item_ids = _normalize_item_ids(item_id) if isinstance(item_id, list) else None
 
         try:
-            account = self.get_account(target_mailbox)
-            mailbox = self.get_mailbox_info(target_mailbox)
-
-            # Get the task
-            task = account.tasks.get(id=item_id)
-
-            # Update fields
-            if "subject" in kwargs:
-                task.subject = kwargs["subject"]
-
-            if "body" in kwargs:
-                task.body = kwargs["body"]
+            account, mailbox = self.get_account_and_mailbox(request.target_mailbox)
+
+            # Collect only the fields the caller supplied
+            supplied = request.model_fields_set
+            changes: Dict[str, Any] = {
+                field_name: getattr(request, field_name)
+                for field_name in _UPDATE_TASK_FIELDS
+                if field_name in supplied
+            }
 
             # Issue #114
-            if "categories" in kwargs:
-                task.categories = list(kwargs["categories"] or [])
+            if "categories" in changes:
+                changes["categories"] = list(changes["categories"] or [])
 
-            if "due_date" in kwargs:
+            if changes.get("due_date") is not None:
                 # Convert string to EWSDate for date-only field
-                due_date_str = kwargs["due_date"]
-                if isinstance(due_date_str, str):
-                    task.due_date = parse_date_tz_aware(due_date_str)
-                else:
-                    # If it's already a datetime object from somewhere else
-                    task.due_date = parse_date_tz_aware(due_date_str.isoformat())
+                changes["due_date"] = parse_date_tz_aware(changes["due_date"])
 
-            if "percent_complete" in kwargs:
-                task.percent_complete = Decimal(str(kwargs["percent_complete"]))
+            if changes.get("percent_complete") is not None:
+                # Decimal(int) is exact; exchangelib's PercentComplete
+                # field is Decimal-typed.
+                changes["percent_complete"] = Decimal(changes["percent_complete"])
 
-            if "importance" in kwargs:
-                task.importance = kwargs["importance"]
+            if changes.get("importance") is not None:
+                changes["importance"] = changes["importance"].value
 
-            # Save changes
-            task.save()
+            if not changes:
+                raise ToolExecutionError("No updates specified")
 
-            self.logger.info(f"Updated task {item_id}")
+            if item_ids is not None:
+                succeeded, failed = _update_tasks(
+                    account, item_ids, changes, _bulk_chunk_size(item_ids),
+                )
+                self.logger.info("%d/%d tasks updated", len(succeeded), len(item_ids))
+                return _bulk_task_response(
+                    "update", "updated", item_ids, succeeded, failed, mailbox=mailbox,
+                )
+
+            _, failed = _update_tasks(account, [item_id], changes, 1)
+            if failed:
+                raise ToolExecutionError(f"Failed to update task: {failed[0]['error']}")
+
+            self.logger.info("Updated task %s", item_id)
 
             return format_success_response(
                 "Task updated successfully",
@@ -332,14 +541,18 @@ class UpdateTaskTool(BaseTool):
                 mailbox=mailbox
             )
 
+        except ToolExecutionError:
+            raise
         except Exception as e:
-            self.logger.error(f"Failed to update task: {e}")
+            self.logger.error("Failed to update task: %s", e)
             raise ToolExecutionError(f"Failed to update task: {e}")
 
 
 class CompleteTaskTool(BaseTool):
     """Tool for marking tasks as complete."""
 
+    __slots__ = ()
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "complete_task",
@@ -347,10 +560,7 @@ class CompleteTaskTool(BaseTool):
             "inputSchema": {
                 "type": "object",
                 "properties": {
-                    "item_id": {
-                        "type": "string",
-                        "description": "Task item ID to complete"
-                    },
+                    "item_id": _item_id_schema("Task item ID to complete"),
                     "target_mailbox": {
                         "type": "string",
                         "description": "Email address to operate on (requires impersonation/delegate access)"
@@ -364,19 +574,28 @@ class CompleteTaskTool(BaseTool):
         """Complete task."""
         item_id = kwargs.get("item_id")
         target_mailbox = kwargs.get("target_mailbox")
+        item_ids = _normalize_item_ids(item_id) if isinstance(item_id, list) else None
 
         try:
-            account = self.get_account(target_mailbox)
-            mailbox = self.get_mailbox_info(target_mailbox)
-
-            # Get and complete the task
-            task = account.tasks.get(id=item_id)
-            task.percent_complete = Decimal('100')
-            task.status = "Completed"
-            task.is_complete = True
-            task.save()
+            account, mailbox = self.get_account_and_mailbox(target_mailbox)
+
+            # Mark complete, writing just status and percent_complete
+            # (is_complete is read-only and derived by Exchange).
+            if item_ids is not None:
+                succeeded, failed = _update_tasks(
+                    account, item_ids, _COMPLETE_TASK_CHANGES,
+                    _bulk_chunk_size(item_ids),
+                )
+                self.logger.info("%d/%d tasks completed", len(succeeded), len(item_ids))
+                return _bulk_task_response(
+                    "complete", "marked as complete", item_ids, succeeded, failed,
+                    mailbox=mailbox,
+                )
+            _, failed = _update_tasks(account, [item_id], _COMPLETE_TASK_CHANGES, 1)
+            if failed:
+                raise ToolExecutionError(f"Failed to complete task: {failed[0]['error']}")
 
-            self.logger.info(f"Completed task {item_id}")
+            self.logger.info("Completed task %s", item_id)
 
             return format_success_response(
                 "Task marked as complete",
@@ -384,14 +603,18 @@ class CompleteTaskTool(BaseTool):
                 mailbox=mailbox
             )
 
+        except ToolExecutionError:
+            raise
         except Exception as e:
-            self.logger.error(f"Failed to complete task: {e}")
+            self.logger.error("Failed to complete task: %s", e)
             raise ToolExecutionError(f"Failed to complete task: {e}")
 
 
 class DeleteTaskTool(BaseTool):
     """Tool for deleting tasks."""
 
+    __slots__ = ()
+
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": "delete_task",
@@ -399,10 +622,7 @@ class DeleteTaskTool(BaseTool):
             "inputSchema": {
                 "type": "object",
                 "properties": {
-                    "item_id": {
-                        "type": "string",
-                        "description": "Task item ID to delete"
-                    },
+                    "item_id": _item_id_schema("Task item ID to delete"),
                     "target_mailbox": {
                         "type": "string",
                         "description": "Email address to operate on (requires impersonation/delegate access)"
@@ -416,16 +636,25 @@ class DeleteTaskTool(BaseTool):
         """Delete task."""
         item_id = kwargs.get("item_id")
         target_mailbox = kwargs.get("target_mailbox")
+        item_ids = _normalize_item_ids(item_id) if isinstance(item_id, list) else None
 
         try:
-            account = self.get_account(target_mailbox)
-            mailbox = self.get_mailbox_info(target_mailbox)
+            account, mailbox = self.get_account_and_mailbox(target_mailbox)
 
-            # Get and delete the task
-            task = account.tasks.get(id=item_id)
-            task.delete()
+            # Delete by ID directly; no need to fetch the task first
+            if item_ids is not None:
+                succeeded, failed = _delete_tasks(
+                    account, item_ids, _bulk_chunk_size(item_ids),
+                )
+                self.logger.info("%d/%d tasks deleted", len(succeeded), len(item_ids))
+                return _bulk_task_response(
+                    "delete", "deleted", item_ids, succeeded, failed, mailbox=mailbox,
+                )
+            _, failed = _delete_tasks(account, [item_id], 1)
+            if failed:
+                raise ToolExecutionError(f"Failed to delete task: {failed[0]['error']}")
 
-            self.logger.info(f"Deleted task {item_id}")
+            self.logger.info("Deleted task %s", item_id)
 
             return format_success_response(
                 "Task deleted successfully",
@@ -433,6 +662,8 @@ class DeleteTaskTool(BaseTool):
                 mailbox=mailbox
             )
 
+        except ToolExecutionError:
+            raise
         except Exception as e:
-            self.logger.error(f"Failed to delete task: {e}")
+            self.logger.error("Failed to delete task: %s", e)
             raise ToolExecutionError(f"Failed to delete task: {e}")
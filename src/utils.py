@@ -1,14 +1,15 @@
 """Utility functions for EWS MCP Server."""
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal as _Decimal
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 import html
 import logging
 import os
 import json
 import re
-from exchangelib import EWSTimeZone, EWSDateTime, EWSDate, FileAttachment
+from exchangelib import EWSTimeZone, EWSDateTime, EWSDate, FileAttachment, Message
 import pytz
 
 # Cached reference to exchangelib's CalendarEventDetails (used by the
@@ -19,6 +20,13 @@ try:
 except Exception:  # pragma: no cover - import guard
     _CalendarEventDetails = None  # type: ignore[assignment]
 
+# Optional C-accelerated encoder for tool responses; stdlib json is used
+# when it is not installed.
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None  # type: ignore[assignment]
+
 
 def _calendar_event_details_to_json(obj: Any) -> Optional[Dict[str, Any]]:
     """Convert an exchangelib ``CalendarEventDetails`` to a plain dict.
@@ -73,15 +81,25 @@ def _ensure_aware_iso(dt: datetime) -> str:
         return str(dt)
 
 
+# EWSTimeZone per configured name. Building one resolves the zoneinfo key
+# and its Windows ID mapping; every datetime conversion needs it, and the
+# set of names seen in practice is one or two.
+_EWS_TIMEZONE_CACHE: Dict[str, EWSTimeZone] = {}
+
+
 def get_timezone():
     """Get the configured timezone as EWSTimeZone."""
     # Get timezone from environment or default to UTC
     tz_name = os.environ.get('TIMEZONE', os.environ.get('TZ', 'UTC'))
-    try:
-        return EWSTimeZone(tz_name)
-    except Exception:
-        # Fallback to UTC if timezone not found
-        return EWSTimeZone('UTC')
+    tz = _EWS_TIMEZONE_CACHE.get(tz_name)
+    if tz is None:
+        try:
+            tz = EWSTimeZone(tz_name)
+        except Exception:
+            # Fallback to UTC if timezone not found
+            tz = EWSTimeZone('UTC')
+        _EWS_TIMEZONE_CACHE[tz_name] = tz
+    return tz
 
 
 def get_pytz_timezone():
@@ -130,52 +148,76 @@ def make_tz_aware(dt: datetime) -> EWSDateTime:
     )
 
 
-def parse_datetime_tz_aware(dt_str: Optional[str]) -> Optional[EWSDateTime]:
+def _configured_tz_name() -> str:
+    """The TIMEZONE (or TZ) setting name, defaulting to UTC."""
+    return os.environ.get('TIMEZONE', os.environ.get('TZ', 'UTC'))
+
+
+# Clients tend to send the same handful of due/reminder strings over and
+# over; the parsed values are immutable, so memoise per (string, TIMEZONE).
+@lru_cache(maxsize=1024)
+def _parse_datetime_cached(dt_str: str, tz_name: str) -> Optional[EWSDateTime]:
+    try:
+        dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
+    except ValueError:
+        logging.getLogger(__name__).debug(f"parse_datetime_tz_aware: bad value: {dt_str!r}")
+        return None
+    # Convert to EWSDateTime with configured timezone
+    return make_tz_aware(dt)
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_cached(date_str: str, tz_name: str) -> Optional[EWSDate]:
+    try:
+        # Works for both date and datetime formats
+        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except ValueError:
+        logging.getLogger(__name__).debug(f"parse_date_tz_aware: bad value: {date_str!r}")
+        return None
+    return _ews_date_of(dt, tz_name)
+
+
+def _ews_date_of(dt: datetime, tz_name: str) -> EWSDate:
+    """Date part of ``dt`` in ``tz_name`` (naive datetimes are taken as-is)."""
+    # Convert timezone-aware datetime to target timezone if needed
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(pytz.timezone(tz_name))
+    # Create EWSDate from the date components only (no time)
+    return EWSDate(dt.year, dt.month, dt.day)
+
+
+def parse_datetime_tz_aware(dt_str: Union[str, datetime, None]) -> Optional[EWSDateTime]:
     """Parse ISO 8601 datetime string and return as EWSDateTime with EWSTimeZone.
 
+    A ``datetime`` (e.g. a field already validated by Pydantic) is converted
+    directly instead of being formatted and re-parsed.
+
     Returns None if the input is empty or unparseable. Callers that require
     a value should check for None before using the result (assigning None to
     exchangelib datetime fields is a hard-to-diagnose silent failure).
     """
     if not dt_str:
         return None
-
-    try:
-        # Parse the datetime string
-        dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-
-        # Convert to EWSDateTime with configured timezone
-        return make_tz_aware(dt)
-    except ValueError:
-        logging.getLogger(__name__).debug(f"parse_datetime_tz_aware: bad value: {dt_str!r}")
-        return None
+    if isinstance(dt_str, datetime):
+        return make_tz_aware(dt_str)
+    return _parse_datetime_cached(dt_str, _configured_tz_name())
 
 
-def parse_date_tz_aware(date_str: Optional[str]) -> Optional[EWSDate]:
+def parse_date_tz_aware(date_str: Union[str, date, None]) -> Optional[EWSDate]:
     """Parse ISO 8601 date/datetime string and return as EWSDate.
 
     Used for task due_date and start_date fields which only accept EWSDate,
-    not EWSDateTime. Accepts date-only ('2025-11-15') and datetime strings.
+    not EWSDateTime. Accepts date-only ('2025-11-15') and datetime strings,
+    or a ``date``/``datetime`` object, which skips the string round trip.
     Returns None on empty/unparseable input.
     """
     if not date_str:
         return None
-
-    try:
-        # Parse the datetime string (works for both date and datetime formats)
-        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-
-        # Convert timezone-aware datetime to target timezone if needed
-        if dt.tzinfo is not None:
-            tz_name = os.environ.get('TIMEZONE', os.environ.get('TZ', 'UTC'))
-            target_tz = pytz.timezone(tz_name)
-            dt = dt.astimezone(target_tz)
-
-        # Create EWSDate from the date components only (no time)
-        return EWSDate(dt.year, dt.month, dt.day)
-    except ValueError:
-        logging.getLogger(__name__).debug(f"parse_date_tz_aware: bad value: {date_str!r}")
-        return None
+    if isinstance(date_str, datetime):
+        return _ews_date_of(date_str, _configured_tz_name())
+    if isinstance(date_str, date):
+        return EWSDate(date_str.year, date_str.month, date_str.day)
+    return _parse_date_cached(date_str, _configured_tz_name())
 
 
 def format_datetime(dt: Optional[datetime]) -> Optional[str]:
@@ -208,6 +250,19 @@ def escape_html(text: Any) -> str:
     return html.escape(str(text), quote=True)
 
 
+# Compiled once: sanitize_html / format_body_for_html run on every
+# send, reply, forward and draft body.
+_SCRIPT_STYLE_BLOCK_RE = re.compile(
+    r"<\s*(script|style)[^>]*>.*?<\s*/\s*\1\s*>", re.IGNORECASE | re.DOTALL
+)
+_EVENT_HANDLER_ATTR_RE = re.compile(
+    r"(?i)\son[a-z]+\s*=\s*(?:\"[^\"]*\"|'[^']*'|[^\s>]+)"
+)
+_JAVASCRIPT_URI_RE = re.compile(r"(?i)(href|src)\s*=\s*([\"']?)\s*javascript:")
+_BODY_TAG_RE = re.compile(r"</?[a-zA-Z][a-zA-Z0-9]*\b[^<>]*/?>")
+_BODY_ENTITY_RE = re.compile(r"&(?:[a-zA-Z]+|#\d+|#x[0-9a-fA-F]+);")
+
+
 def sanitize_html(html_content: str) -> str:
     """Sanitize HTML that will be sent to Exchange.
 
@@ -217,26 +272,18 @@ def sanitize_html(html_content: str) -> str:
     """
     if not html_content:
         return ""
+    # Every pattern below needs a tag to act on. Plain-text content (e.g. a
+    # quoted original with a text-only body) has none, so skip all three
+    # passes.
+    if "<" not in html_content:
+        return html_content
 
-    cleaned = re.sub(
-        r"<\s*(script|style)[^>]*>.*?<\s*/\s*\1\s*>",
-        "",
-        html_content,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
+    cleaned = _SCRIPT_STYLE_BLOCK_RE.sub("", html_content)
     # Strip event handlers (onclick=, onerror=, ...). Matches on attribute
     # boundaries to avoid clobbering CSS selectors.
-    cleaned = re.sub(
-        r"(?i)\son[a-z]+\s*=\s*(?:\"[^\"]*\"|'[^']*'|[^\s>]+)",
-        "",
-        cleaned,
-    )
+    cleaned = _EVENT_HANDLER_ATTR_RE.sub("", cleaned)
     # Neutralise javascript: URIs inside href/src attributes.
-    cleaned = re.sub(
-        r"(?i)(href|src)\s*=\s*([\"']?)\s*javascript:",
-        r"\1=\2about:blank;",
-        cleaned,
-    )
+    cleaned = _JAVASCRIPT_URI_RE.sub(r"\1=\2about:blank;", cleaned)
     return cleaned
 
 
@@ -260,12 +307,13 @@ def format_body_for_html(body: Optional[str]) -> str:
     body = body.strip()
     # Real opening/closing tag (e.g. <p>, </div>, <br/>). The previous
     # `<[^>]+>` matched plain text like "x < y" and silently routed it
-    # through sanitize_html, which would not escape the `<`.
-    has_tag = bool(re.search(r"</?[a-zA-Z][a-zA-Z0-9]*\b[^<>]*/?>", body))
+    # through sanitize_html, which would not escape the `<`. The substring
+    # checks skip the regex scan entirely for plain-text bodies.
+    has_tag = "<" in body and _BODY_TAG_RE.search(body) is not None
     # Named or numeric HTML entity: &amp; &gt; &nbsp; &#39; &#x2014; ...
     # We only match terminated entities (`;`) so a stray `&` followed by
     # non-entity text still falls through to the escape branch.
-    has_entity = bool(re.search(r"&(?:[a-zA-Z]+|#\d+|#x[0-9a-fA-F]+);", body))
+    has_entity = "&" in body and _BODY_ENTITY_RE.search(body) is not None
     if has_tag or has_entity:
         return sanitize_html(body)
     return escape_html(body).replace("\n", "<br/>")
@@ -280,6 +328,16 @@ def truncate_text(text: str, max_length: int = 100) -> str:
     return text[:max_length - 3] + "..."
 
 
+# Exchange's default EWSFindCountLimit; larger FindItem pages are rejected.
+MAX_EWS_PAGE_SIZE = 1000
+
+
+def ews_page_size(ews_client: Any) -> int:
+    """Configured FindItem page size (``EWS_PAGE_SIZE``), default 1000."""
+    config = getattr(ews_client, "config", None)
+    return int(getattr(config, "ews_page_size", MAX_EWS_PAGE_SIZE) or MAX_EWS_PAGE_SIZE)
+
+
 def safe_get(obj: Any, attr: str, default: Any = None) -> Any:
     """Safely get attribute from object."""
     try:
@@ -288,6 +346,21 @@ def safe_get(obj: Any, attr: str, default: Any = None) -> Any:
         return default
 
 
+def email_of(mailbox: Any) -> str:
+    """``email_address`` of a Mailbox-like value, or "" when unset/None."""
+    return getattr(mailbox, "email_address", None) or ""
+
+
+def emails_of(item: Any, attr: str) -> List[str]:
+    """Return the non-empty ``email_address`` values of a recipient list.
+
+    ``attr`` names the recipient field on ``item`` (``to_recipients``,
+    ``cc_recipients``, ...). Missing or unset fields yield ``[]``.
+    """
+    recipients = safe_get(item, attr, None) or ()
+    return [e for e in (getattr(r, "email_address", None) for r in recipients) if e]
+
+
 def ews_id_to_str(ews_id: Any) -> Optional[str]:
     """Convert an EWS ID object to a string.
 
@@ -410,9 +483,23 @@ class EWSJSONEncoder(json.JSONEncoder):
         return str(result)
 
 
+_EWS_JSON_ENCODER = EWSJSONEncoder()
+
+
 def safe_json_dumps(obj: Any, **kwargs) -> str:
     """Safely serialize an object to JSON, handling EWS objects.
 
+    Plain calls (no kwargs) go through orjson when it is installed, with
+    the same ``EWSJSONEncoder.default`` fallback for EWS types. Datetimes
+    are passed through to that fallback too, so naive values still get the
+    configured TIMEZONE offset. Calls with json.dumps options such as
+    ``indent``, and payloads orjson rejects (e.g. integers over 64 bits),
+    use the stdlib encoder.
+
+    One deliberate difference on the orjson path: NaN and Infinity floats
+    are written as ``null`` (valid JSON) where json.dumps writes the bare
+    ``NaN``/``Infinity`` tokens that strict JSON parsers reject.
+
     Args:
         obj: Object to serialize
         **kwargs: Additional arguments to pass to json.dumps
@@ -420,6 +507,15 @@ def safe_json_dumps(obj: Any, **kwargs) -> str:
     Returns:
         JSON string representation
     """
+    if _orjson is not None and not kwargs:
+        try:
+            return _orjson.dumps(
+                obj,
+                default=_EWS_JSON_ENCODER.default,
+                option=_orjson.OPT_NON_STR_KEYS | _orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode("utf-8")
+        except _orjson.JSONEncodeError:
+            pass
     return json.dumps(obj, cls=EWSJSONEncoder, **kwargs)
 
 
@@ -654,17 +750,25 @@ def strip_body_by_default(
     return item
 
 
-def find_message_for_account(account, message_id):
+def find_message_for_account(account, message_id, only_fields=None):
     """
-    Search for a message across multiple folders for a specific account.
+    Find a message by ID for a specific account.
 
-    This function searches common folders for a message by ID, including
-    custom subfolders. This is necessary because Exchange Web Services
-    requires knowing which folder a message is in to retrieve it.
+    EWS item IDs are unique within a mailbox, so the message is first
+    requested directly with a single ``GetItem`` via ``account.fetch``.
+    Only when that fails (e.g. an older server or an ID the batch call
+    rejects), or returns something other than a ``Message`` (a meeting
+    request, task, ...), do we fall back to scanning common folders and
+    their subfolders one ``folder.get`` at a time.
+
+    Items returned by the direct fetch carry no ``folder`` attribute;
+    use ``parent_folder_id`` if the containing folder is needed.
 
     Args:
         account: The Exchange Account object (primary or impersonated)
         message_id: The Exchange message ID to find
+        only_fields: Optional item field names to restrict the direct
+            fetch to. The folder-scan fallback always loads full items.
 
     Returns:
         The message item if found
@@ -674,6 +778,20 @@ def find_message_for_account(account, message_id):
     """
     from .exceptions import ToolExecutionError
 
+    # Fast path: one GetItem round-trip. exchangelib yields exceptions
+    # (ErrorItemNotFound etc.) in place of items rather than raising, and
+    # the ID may name a non-Message item; callers rely on Message-only
+    # methods such as reply/forward, so anything else takes the slow path.
+    try:
+        fetched = next(iter(account.fetch(
+            ids=[(message_id, None)],
+            only_fields=list(only_fields) if only_fields else None,
+        )), None)
+    except Exception:
+        fetched = None
+    if isinstance(fetched, Message):
+        return fetched
+
     # List of common folders to search (in priority order)
     folders_to_search = [
         ("inbox", account.inbox),